@@ -0,0 +1,220 @@
+import os
+import tkinter as tk
+from time import perf_counter_ns
+from clickrate import ClickCounter, ClickStats
+from render import RenderCache
+from config_store import shared_store
+from eventbus import EventBus, MOUSE, CONFIG, MOUSE_LEFT, MOUSE_RIGHT, start_mouse_hook
+from ticker import FrameScheduler
+
+class CPSOverlay:
+    def __init__(self, window, bus=None, store=None, listen=True, scheduler=None):
+        self.window = window
+        self.window.title("CPS Overlay")
+        self.script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.store = store or shared_store(self.script_dir)
+        self.config = self.store.section("cps")
+        self.enabled = self.config.get("enabled", True)
+        initial_x = self.config.get("x", 0)
+        initial_y = self.config.get("y", 0)
+        try:
+            self.window.geometry(f"140x40+{int(initial_x)}+{int(initial_y)}")
+        except (ValueError, tk.TclError):
+            self.window.geometry("140x40+0+0")
+        self.window.attributes('-topmost', True)
+        self.window.attributes('-alpha', 0.9)
+        self.window.overrideredirect(True)
+        window = self.config.get("cps_window", 1.0)
+        self.left_clicks = ClickCounter(window)
+        self.right_clicks = ClickCounter(window)
+        double_click_ms = self.config.get("double_click_ms", 40)
+        self.left_stats = ClickStats(double_click_ms)
+        self.right_stats = ClickStats(double_click_ms)
+        self.expanded = False
+        self.stats_seen = None
+        self.events = 0
+        self.left_cps = 0.0
+        self.right_cps = 0.0
+        self.canvas = tk.Canvas(self.window, bg='#212121', highlightthickness=0)
+        self.canvas.pack(fill='both', expand=True)
+        self.canvas.create_oval(0, 0, 28, 28, fill='#212121', outline='#212121')
+        self.canvas.create_oval(152, 0, 180, 28, fill='#212121', outline='#212121')
+        self.canvas.create_oval(0, 12, 28, 40, fill='#212121', outline='#212121')
+        self.canvas.create_oval(152, 12, 180, 40, fill='#212121', outline='#212121')
+        self.canvas.create_rectangle(14, 0, 166, 40, fill='#212121', outline='#212121')
+        self.canvas.create_rectangle(0, 14, 180, 26, fill='#212121', outline='#212121')
+        try:
+            self.label = self.canvas.create_text(70, 20, text="CPS: 0-0", font=("Inter", 12, "bold"), fill="white")
+        except tk.TclError:
+            self.label = self.canvas.create_text(70, 20, text="CPS: 0-0", font=("Courier New", 12, "bold"), fill="white")
+        self.renderer = RenderCache(self.canvas)
+        self.create_stats_view()
+        self.canvas.bind("<Button-1>", self.start_drag)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.stop_drag)
+        self.canvas.bind("<Button-2>", self.toggle_expanded)
+        self.canvas.bind("<Button-3>", self.toggle_visibility)
+        self.drag_data = {"x": 0, "y": 0}
+        if scheduler is None:
+            scheduler = FrameScheduler(self.window, self.store.section("render").get("fps", 100))
+            scheduler.start()
+        if bus is None:
+            bus = EventBus(self.window)
+            bus.start()
+        self.bus = bus
+        self.scheduler = scheduler
+        self.bus.subscribe(MOUSE, self.on_mouse)
+        self.bus.subscribe(CONFIG, self.on_config)
+        if listen:
+            self.start_mouse_listener()
+        self.scheduler.register(self)
+        self.update_visibility()
+
+    def save_config(self, x, y):
+        self.store.update("cps", x=x, y=y, enabled=self.enabled)
+
+    def start_mouse_listener(self):
+        start_mouse_hook(self.bus)
+
+    def on_mouse(self, t, code, down):
+        self.events += 1
+        if down:
+            if code == MOUSE_LEFT:
+                self.left_clicks.add(t)
+                self.left_stats.add(t)
+            elif code == MOUSE_RIGHT:
+                self.right_clicks.add(t)
+                self.right_stats.add(t)
+            else:
+                return
+            self.scheduler.wake(self)
+
+    def on_config(self, t, section, changes):
+        if section != "cps":
+            return
+        if "x" in changes or "y" in changes:
+            try:
+                self.window.geometry(f"+{int(self.config.get('x', 0))}+{int(self.config.get('y', 0))}")
+            except (ValueError, tk.TclError):
+                pass
+        if "cps_window" in changes:
+            try:
+                window = float(self.config["cps_window"])
+            except (ValueError, TypeError, KeyError):
+                window = 0
+            if window > 0:
+                self.left_clicks.set_window(window)
+                self.right_clicks.set_window(window)
+        if "double_click_ms" in changes:
+            try:
+                double_click_ns = int(float(self.config["double_click_ms"]) * 1e6)
+            except (ValueError, TypeError, KeyError):
+                double_click_ns = -1
+            if double_click_ns >= 0:
+                self.left_stats.double_click_ns = double_click_ns
+                self.right_stats.double_click_ns = double_click_ns
+        if "enabled" in changes:
+            self.enabled = changes["enabled"]
+            self.update_visibility()
+        else:
+            self.scheduler.wake(self)
+
+    def create_stats_view(self):
+        # Hidden until the overlay is expanded; refresh() skips it entirely while collapsed.
+        self.stats_label = self.canvas.create_text(
+            70, 44, text="", anchor="n", font=("Courier New", 9), fill="white", state="hidden"
+        )
+        buckets = len(self.left_stats.histogram)
+        width = 130 / buckets
+        self.bar_x = [(5 + i * width, 5 + (i + 1) * width) for i in range(buckets)]
+        self.bars = [
+            self.canvas.create_rectangle(x0, 145, x1, 145, fill="#4fc3f7", width=0, state="hidden")
+            for x0, x1 in self.bar_x
+        ]
+
+    def toggle_expanded(self, event=None):
+        self.expanded = not self.expanded
+        state = "normal" if self.expanded else "hidden"
+        self.canvas.itemconfigure(self.stats_label, state=state)
+        for bar in self.bars:
+            self.canvas.itemconfigure(bar, state=state)
+        self.window.geometry("140x150" if self.expanded else "140x40")
+        self.stats_seen = None
+        self.scheduler.wake(self)
+
+    def refresh_stats(self):
+        left = self.left_stats
+        right = self.right_stats
+        seen = (left.clicks, right.clicks)
+        if seen == self.stats_seen:
+            return
+        self.stats_seen = seen
+        self.renderer.text(self.stats_label, (
+            int(self.left_clicks.peak_rate()), int(self.right_clicks.peak_rate()),
+            left.mean_ns / 1e6, left.stddev_ns() / 1e6, left.double_clicks, right.double_clicks,
+        ), "peak {}-{}\nint {:.0f}\u00b1{:.1f} ms\ndbl {}-{}")
+        histogram = left.histogram
+        top = max(histogram) or 1
+        coords = self.canvas.coords
+        for bar, (x0, x1), count in zip(self.bars, self.bar_x, histogram):
+            coords(bar, x0, 145 - 50 * count / top, x1, 145)
+
+    def metrics(self):
+        yield "input_events_total", {"overlay": "cps", "hook": "mouse"}, self.events
+        yield "clicks_total", {"button": "left"}, self.left_stats.clicks
+        yield "clicks_total", {"button": "right"}, self.right_stats.clicks
+        yield "cps", {"button": "left"}, self.left_cps
+        yield "cps", {"button": "right"}, self.right_cps
+        yield "render_calls_total", {"overlay": "cps", "result": "issued"}, self.renderer.issued
+        yield "render_calls_total", {"overlay": "cps", "result": "skipped"}, self.renderer.skipped
+
+    def stats(self):
+        return {
+            "left": dict(self.left_stats.snapshot(), peak_cps=self.left_clicks.peak_rate()),
+            "right": dict(self.right_stats.snapshot(), peak_cps=self.right_clicks.peak_rate()),
+        }
+
+    def start_drag(self, event):
+        self.drag_data["x"] = event.x
+        self.drag_data["y"] = event.y
+
+    def on_drag(self, event):
+        x = event.x_root - self.drag_data["x"]
+        y = event.y_root - self.drag_data["y"]
+        self.window.geometry(f"+{x}+{y}")
+
+    def stop_drag(self, event):
+        x = self.window.winfo_x()
+        y = self.window.winfo_y()
+        self.save_config(x, y)
+        self.drag_data["x"] = 0
+        self.drag_data["y"] = 0
+
+    def tick(self, now):
+        self.refresh(now)
+        # Keep ticking while clicks are still decaying out of the window.
+        return bool(self.left_cps or self.right_cps)
+
+    def refresh(self, now=None):
+        if now is None:
+            now = perf_counter_ns()
+        self.left_cps = self.left_clicks.rate(now)
+        self.right_cps = self.right_clicks.rate(now)
+        self.renderer.text(self.label, (int(self.left_cps), int(self.right_cps)), "CPS: {}-{}")
+        if self.expanded:
+            self.refresh_stats()
+
+    def toggle_visibility(self, event):
+        self.enabled = not self.enabled
+        self.update_visibility()
+        self.save_config(self.window.winfo_x(), self.window.winfo_y())
+
+    def update_visibility(self):
+        if self.enabled:
+            self.window.deiconify()
+        else:
+            self.window.withdraw()
+        self.scheduler.wake(self)
+
+def start(app):
+    return CPSOverlay(app.toplevel(), app.bus, app.store, app.listen, app.scheduler)
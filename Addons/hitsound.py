@@ -1,37 +1,258 @@
-import pygame
 import os
-import pyautogui
-def is_pixel_red(x, y):
+import sys
+import zlib
+import struct
+import threading
+import multiprocessing
+from array import array
+from time import perf_counter_ns
+from frames import open_source, is_red
+from scheduler import PollScheduler
+from config_store import shared_store
+from hits import HitEvent, HitStream
+from eventbus import HIT
+import tracing
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_SECTIONS = ("audio", "detector", "classifier")
+
+# Slots of the stats array shared with whoever started the detector.
+STAT_LOOPS = 0
+STAT_HITS = 1
+STAT_RATE_HZ = 2
+STAT_CAPTURE_US = 3
+STAT_HEARTBEAT_NS = 4
+STAT_SOUND_US = 5
+STAT_SOUND_TOTAL_US = 6
+STAT_SOUNDS = 7
+STAT_FIELDS = 8
+
+HIT_RECORD = struct.Struct("<QQ")
+
+def detector_config(store=None):
+    store = store or shared_store(SCRIPT_DIR)
+    return {name: dict(store.section(name)) for name in CONFIG_SECTIONS}
+
+def sound_subscriber(player, stats):
+    tracer = tracing.tracer
+    def play(event):
+        t_play = perf_counter_ns()
+        latency_us = player.play() / 1000
+        stats[STAT_SOUND_US] = latency_us
+        stats[STAT_SOUND_TOTAL_US] += latency_us
+        stats[STAT_SOUNDS] += 1
+        if tracer is not None:
+            t_done = perf_counter_ns()
+            tracer.record("play", t_play, t_done)
+            tracer.record("hit_to_sound", event.t, t_done)
+    return play
+
+def main_pixel_detection(source=None, scheduler=None, store=None, config=None, stop=None, stats=None, hits=None):
+    # pygame and NumPy are imported here, on the detector thread, so they stay
+    # off the path to the first overlay being drawn.
     try:
-        pixel_color = pyautogui.pixel(x, y)
-        return pixel_color[0] > 200 and pixel_color[1] < 50 and pixel_color[2] < 50
-    except Exception:
-        return False
-def main():
-    pygame.mixer.init()
-    screen_width, screen_height = pyautogui.size()
-    middle_x = screen_width // 2
-    middle_y = screen_height // 2
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    hitsound = os.path.join(script_dir, "hit.mp3")
+        from classifier import create_classifier
+    except ImportError:
+        create_classifier = None
+    if config is None:
+        config = detector_config(store)
+    audio = config["audio"]
+    detector = config["detector"]
     try:
-        pygame.mixer.music.load(hitsound)
-    except Exception:
-        return
-    canPlay = True
+        from audio import HitSoundPlayer
+        player = HitSoundPlayer(
+            os.path.join(SCRIPT_DIR, "hit.mp3"), audio.get("channels", 4), audio.get("buffer", 256)
+        )
+    except Exception as e:
+        # The sound is just one subscriber; hits still reach the bus and the recorder.
+        print(f"hit sound unavailable: {e}", file=sys.stderr)
+        player = None
+    if source is None:
+        region = detector.get("region", 16)
+        source = open_source(detector.get("source", "screen"), region, region)
+    if scheduler is None:
+        scheduler = PollScheduler(detector.get("target_hz", 240), detector.get("idle_hz", 30))
+    if create_classifier is not None:
+        classifier = create_classifier(source, config["classifier"])
+        classify = classifier.classify
+    else:
+        def classify():
+            return is_red(source.buffer, source.center_offset)
+    if stats is None:
+        stats = array("d", bytes(8 * STAT_FIELDS))
+    if hits is None:
+        hits = HitStream()
+    if player is not None:
+        play = sound_subscriber(player, stats)
+        hits.subscribe(play, inline=True)
+    tracer = tracing.tracer
+    cooldown_ns = int(detector.get("cooldown_ms", 200) * 1e6)
+    was_hit = False
+    last_hit = -cooldown_ns
+    seq = 0
+    last_crc = 0
+    next_report = perf_counter_ns() + 1_000_000_000
     try:
-        while True:
-            if is_pixel_red(middle_x, middle_y) and canPlay:
-                try:
-                    pygame.mixer.music.play()
-                    canPlay = False
-                    time.sleep(0.2)
-                except Exception:
-                    pass
-            elif not is_pixel_red(middle_x, middle_y):
-                if not canPlay:
-                    canPlay = True
+        while stop is None or not stop.is_set():
+            scheduler.wait()
+            t_capture = perf_counter_ns()
+            grabbed = source.grab()
+            t_classify = perf_counter_ns()
+            stats[STAT_CAPTURE_US] = (t_classify - t_capture) / 1000
+            stats[STAT_LOOPS] += 1
+            if tracer is not None:
+                tracer.record("capture", t_capture, t_classify)
+            hit = grabbed and classify()
+            if tracer is not None:
+                t_trigger = perf_counter_ns()
+                tracer.record("classify", t_classify, t_trigger)
+            # Rising edge only, and a cooldown measured in capture time, so the loop
+            # keeps watching the screen instead of sleeping after a hit.
+            if hit and not was_hit and t_capture - last_hit >= cooldown_ns:
+                last_hit = t_capture
+                seq += 1
+                stats[STAT_HITS] += 1
+                if tracer is not None:
+                    tracer.record("trigger", t_trigger, perf_counter_ns())
+                hits.publish(HitEvent(t_capture, seq))
+            was_hit = hit
+            crc = zlib.crc32(source.buffer)
+            scheduler.mark(crc != last_crc)
+            last_crc = crc
+            if t_capture >= next_report:
+                stats[STAT_RATE_HZ] = scheduler.stats(reset=True)["achieved_hz"]
+                stats[STAT_HEARTBEAT_NS] = t_capture
+                next_report = t_capture + 1_000_000_000
     except KeyboardInterrupt:
-        pygame.mixer.quit()
-if __name__ == "__main__":
-    main()
\ No newline at end of file
+        pass
+    finally:
+        if player is not None:
+            hits.unsubscribe(play)
+            player.close()
+        source.close()
+
+def stats_dict(stats):
+    return {
+        "loops": int(stats[STAT_LOOPS]),
+        "hits": int(stats[STAT_HITS]),
+        "rate_hz": stats[STAT_RATE_HZ],
+        "capture_us": stats[STAT_CAPTURE_US],
+        "sound_us": stats[STAT_SOUND_US],
+        "sound_total_us": stats[STAT_SOUND_TOTAL_US],
+    }
+
+class DetectorThread:
+    def __init__(self, config):
+        self.config = config
+        self.stats = array("d", bytes(8 * STAT_FIELDS))
+        self.hits = HitStream()
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="hit-detector", daemon=True)
+
+    def run(self):
+        main_pixel_detection(config=self.config, stop=self.stop_event, stats=self.stats, hits=self.hits)
+
+    def subscribe(self, callback, inline=False):
+        self.hits.subscribe(callback, inline)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def is_alive(self):
+        return self.thread.is_alive()
+
+    def join(self, timeout=None):
+        self.thread.join(timeout)
+
+    def stop(self, timeout=2.0):
+        self.stop_event.set()
+        self.thread.join(timeout)
+        self.hits.close()
+
+    def snapshot(self):
+        return stats_dict(self.stats)
+
+    def metrics(self):
+        stats = self.stats
+        yield "detector_loops_total", {}, stats[STAT_LOOPS]
+        yield "detector_rate_hz", {}, stats[STAT_RATE_HZ]
+        yield "detector_capture_seconds", {}, stats[STAT_CAPTURE_US] / 1e6
+        yield "detector_hits_total", {}, stats[STAT_HITS]
+        yield "sound_trigger_last_seconds", {}, stats[STAT_SOUND_US] / 1e6
+        yield "sound_trigger_seconds_sum", {}, stats[STAT_SOUND_TOTAL_US] / 1e6
+        yield "sound_trigger_seconds_count", {}, stats[STAT_SOUNDS]
+
+def _process_main(config, conn, stats, stop):
+    hits = HitStream()
+    def forward(event):
+        conn.send_bytes(HIT_RECORD.pack(*event))
+    # Not inline: the sound subscribes inline later and must not wait on the pipe.
+    hits.subscribe(forward)
+    try:
+        main_pixel_detection(config=config, stop=stop, stats=stats, hits=hits)
+    finally:
+        hits.close()
+        conn.close()
+
+class DetectorProcess(DetectorThread):
+    def __init__(self, config):
+        # spawn everywhere so Linux behaves like Windows and no Tk state is forked.
+        ctx = multiprocessing.get_context("spawn")
+        self.config = config
+        self.stats = ctx.Array("d", STAT_FIELDS, lock=False)
+        self.hits = HitStream()
+        self.stop_event = ctx.Event()
+        self.conn, child_conn = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(
+            target=_process_main, args=(config, child_conn, self.stats, self.stop_event),
+            name="hit-detector", daemon=True,
+        )
+        self._child_conn = child_conn
+        self.thread = threading.Thread(target=self.forward_hits, name="hit-forwarder", daemon=True)
+
+    def forward_hits(self):
+        buf = bytearray(HIT_RECORD.size)
+        try:
+            while True:
+                self.conn.recv_bytes_into(buf)
+                self.hits.publish(HitEvent._make(HIT_RECORD.unpack_from(buf)))
+        except (EOFError, OSError):
+            pass
+
+    def start(self):
+        self.process.start()
+        self._child_conn.close()
+        self.thread.start()
+        return self
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def join(self, timeout=None):
+        self.process.join(timeout)
+
+    def stop(self, timeout=2.0):
+        self.stop_event.set()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self.conn.close()
+        self.hits.close()
+
+def start(app):
+    config = detector_config(app.store)
+    if config["detector"].get("mode", "thread") == "process":
+        if tracing.tracer is not None:
+            # The tracer lives in this process; the spawned detector never sees it.
+            print("detector tracing is not available in process mode; "
+                  "capture/classify/trigger/play stages will be missing", file=sys.stderr)
+        detector = DetectorProcess(config)
+    else:
+        detector = DetectorThread(config)
+    if app.bus is not None:
+        # Overlays and the recorder see hits as bus events on the Tk thread.
+        post = app.bus.post
+        detector.subscribe(lambda event: post(HIT, 0, True, event.t))
+    return detector.start()
@@ -1,139 +1,251 @@
-import tkinter as tk
-from tkinter import ttk
-import keyboard
-import threading
-import json
 import os
-from time import time
-from pynput import mouse
+import sys
+import tkinter as tk
+from time import perf_counter_ns
+from render import RenderCache
+from keystats import KeyStats
+from config_store import shared_store
+from eventbus import EventBus, KEYBOARD, MOUSE, CONFIG, MOUSE_BUTTONS, start_key_hook, start_mouse_hook
+import tracing
+
+DEFAULT_LAYOUT = [
+    {"key": "w", "x": 105, "y": 60, "w": 60},
+    {"key": "a", "x": 30, "y": 135, "w": 60},
+    {"key": "s", "x": 105, "y": 135, "w": 60},
+    {"key": "d", "x": 180, "y": 135, "w": 60},
+    {"key": "space", "x": 105, "y": 195, "w": 215, "h": 45},
+]
+
+
+def check_layout(layout):
+    # Raises on anything build_layout could not draw, before the canvas is cleared.
+    for entry in layout:
+        float(entry["x"])
+        float(entry["y"])
+        float(entry.get("w", 60))
+        float(entry.get("h", 0))
+        int(entry.get("font", 18))
+        (entry.get("key") or entry.get("mouse", "")).upper()
 
-key = input("Enter your key: ")
 
 class KeystrokeOverlay:
-    def __init__(self, window):
+    def __init__(self, window, bus=None, store=None, listen=True):
         self.window = window
         self.window.title("Keystroke Overlay")
-        self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.config_path = os.path.join(self.script_dir, "keystroke_config.json")
-        self.config = self.load_config()
+        self.script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.store = store or shared_store(self.script_dir)
+        self.config = self.store.section("keystrokes")
         initial_x = self.config.get("x", 10)
         initial_y = self.config.get("y", 10)
         self.enabled = self.config.get("enabled", True)
-        self.window.geometry(f"210x270+{initial_x}+{initial_y}")
-        self.window.wm_attributes('-transparentcolor', 'black')
+        width = self.config.get("width", 210)
+        height = self.config.get("height", 270)
+        self.window.geometry(f"{width}x{height}+{initial_x}+{initial_y}")
+        try:
+            self.window.wm_attributes('-transparentcolor', 'black')
+        except tk.TclError:
+            pass
         self.window.attributes('-topmost', True)
         self.window.overrideredirect(True)
         self.pressed_keys = set()
+        self.key_events = 0
+        self.mouse_events = 0
+        self.scan_codes = {}
+        self.key_hook = None
+        self.hooked = set()
+        self.keystats = KeyStats(strafe=self.config.get("strafe_keys", ("a", "d")))
         self.create_ui()
+        self.renderer = RenderCache(self.canvas)
+        self.tracer = tracing.tracer
+        self.trace_pending = []
         self.canvas.bind("<Button-1>", self.start_drag)
         self.canvas.bind("<B1-Motion>", self.on_drag)
         self.canvas.bind("<ButtonRelease-1>", self.stop_drag)
+        self.canvas.bind("<Button-2>", self.print_summary)
         self.canvas.bind("<Button-3>", self.toggle_visibility)
         self.drag_data = {"x": 0, "y": 0}
-        self.start_keyboard_listener()
+        if bus is None:
+            bus = EventBus(self.window)
+            bus.start()
+        self.bus = bus
+        self.bus.subscribe(KEYBOARD, self.on_key)
+        self.bus.subscribe(MOUSE, self.on_mouse)
+        self.bus.subscribe(CONFIG, self.on_config)
+        if listen:
+            self.start_keyboard_listener()
         self.update_visibility()
 
-    def load_config(self):
-        try:
-            if not os.path.exists(self.config_path):
-                default_config = {"x": 10, "y": 10, "enabled": True}
-                with open(self.config_path, 'w') as f:
-                    json.dump(default_config, f, indent=4)
-                return default_config
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {"x": 10, "y": 10, "enabled": True}
-
     def save_config(self):
-        self.config["x"] = self.window.winfo_x()
-        self.config["y"] = self.window.winfo_y()
-        self.config["enabled"] = self.enabled
-        try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
-        except (IOError, PermissionError):
-            pass
+        self.store.update(
+            "keystrokes", x=self.window.winfo_x(), y=self.window.winfo_y(), enabled=self.enabled
+        )
 
     def create_ui(self):
         self.canvas = tk.Canvas(self.window, bg='black', highlightthickness=0)
         self.canvas.pack(fill='both', expand=True)
-        key_size = 60
-        padding = 15
-        w_x, w_y = 105, 60
-        self.w_rect = self.create_key_rect(w_x, w_y, key_size, 'W')
-        a_x, a_y = w_x - key_size - padding, w_y + key_size + padding
-        self.a_rect = self.create_key_rect(a_x, a_y, key_size, 'A')
-        s_x, s_y = w_x, a_y
-        self.s_rect = self.create_key_rect(s_x, s_y, key_size, 'S')
-        d_x, d_y = w_x + key_size + padding, a_y
-        self.d_rect = self.create_key_rect(d_x, d_y, key_size, 'D')
-        space_width = 215
-        space_height = 45
-        space_y = a_y + key_size
-        space_x = 105
-        self.space_rect = self.create_space_rect(space_x, space_y, space_width, space_height)
+        self.build_layout()
 
-    def create_key_rect(self, x, y, size, key_text):
-        outline_color = "#555555"
-        fill_color = "#333333"
-        text_color = "#FFFFFF"
-        rect_id = self.canvas.create_rectangle(
-            x - size / 2, y - size / 2, x + size / 2, y + size / 2,
-            fill=fill_color, outline=outline_color, width=2,
-            tags=f"{key_text.lower()}_key"
-        )
-        text_id = self.canvas.create_text(
-            x, y,
-            text=key_text,
-            font=("Arial", 18, "bold"),
-            fill=text_color,
-            tags=f"{key_text.lower()}_text"
-        )
-        return rect_id
-
-    def create_space_rect(self, x, y, width, height):
+    def build_layout(self):
+        layout = self.config.get("layout") or DEFAULT_LAYOUT
+        try:
+            check_layout(layout)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            # A broken hot-reloaded layout keeps what is already on screen.
+            layout = getattr(self, "layout", DEFAULT_LAYOUT)
+        self.canvas.delete("all")
+        self.layout = layout
+        self.rects = []
+        self.names = []
+        self.pressed = []
+        # Bus codes (key names, scan codes once the hook resolves them, mouse button
+        # codes) map straight to a slot index, so dispatch is one dict lookup.
+        self.slots = {}
+        self.mouse_slots = {}
+        for entry in self.layout:
+            slot = len(self.rects)
+            w = entry.get("w", 60)
+            h = entry.get("h", w)
+            name = entry.get("key") or entry.get("mouse", "")
+            label = entry.get("label", name.upper())
+            self.rects.append(self.create_key_rect(entry["x"], entry["y"], w, h, label, entry.get("font", 18)))
+            self.names.append(name)
+            self.pressed.append(False)
+            if "mouse" in entry:
+                code = MOUSE_BUTTONS.get(entry["mouse"])
+                if code is not None:
+                    self.mouse_slots[code] = slot
+            else:
+                self.slots[name] = slot
+        self.stat_keys = [self.keystats.key(name) for name in self.names]
+        for name, scan_codes in self.scan_codes.items():
+            if name in self.slots:
+                for code in scan_codes:
+                    self.slots[code] = self.slots[name]
+
+    def create_key_rect(self, x, y, width, height, key_text, font_size=18):
         outline_color = "#555555"
         fill_color = "#333333"
         text_color = "#FFFFFF"
         rect_id = self.canvas.create_rectangle(
             x - width / 2, y - height / 2, x + width / 2, y + height / 2,
-            fill=fill_color, outline=outline_color, width=2,
-            tags="space_key"
+            fill=fill_color, outline=outline_color, width=2
         )
-        text_id = self.canvas.create_text(
+        self.canvas.create_text(
             x, y,
-            text="SPACE",
-            font=("Arial", 18, "bold"),
-            fill=text_color,
-            tags="space_text"
+            text=key_text,
+            font=("Arial", font_size, "bold"),
+            fill=text_color
         )
         return rect_id
 
     def start_keyboard_listener(self):
-        def on_key_event(e):
-            if e.event_type == keyboard.KEY_DOWN:
-                key = e.name.lower()
-                if key in ['w', 'a', 's', 'd', 'space']:
-                    if key not in self.pressed_keys:
-                        self.pressed_keys.add(key)
-                        self.update_key_visual(key, True)
-            elif e.event_type == keyboard.KEY_UP:
-                key = e.name.lower()
-                if key in ['w', 'a', 's', 'd', 'space']:
-                    if key in self.pressed_keys:
-                        self.pressed_keys.remove(key)
-                        self.update_key_visual(key, False)
-        keyboard_thread = threading.Thread(target=lambda: keyboard.hook(on_key_event))
-        keyboard_thread.daemon = True
-        keyboard_thread.start()
+        self.key_hook = "hook"
+        self.hook_new_keys()
+        if self.mouse_slots:
+            start_mouse_hook(self.bus)
+
+    def resolve_scan_codes(self):
+        self.key_hook = "resolve"
+        self.hook_new_keys()
+
+    def hook_new_keys(self):
+        # Keys already hooked keep their hooks across layout reloads.
+        keys = [name for name in self.slots if isinstance(name, str) and name not in self.hooked]
+        if keys:
+            self.hooked.update(keys)
+            start_key_hook(self.bus, keys, self.map_scan_codes, hook=self.key_hook == "hook")
+
+    def map_scan_codes(self, codes):
+        # Runs on the hook thread before any key is hooked; swap in a new dict whole.
+        self.scan_codes.update(codes)
+        slots = dict(self.slots)
+        for name, scan_codes in codes.items():
+            for code in scan_codes:
+                if name in self.slots:
+                    slots[code] = self.slots[name]
+        self.slots = slots
+
+    def on_config(self, t, section, changes):
+        # Hot reload: only what changed in our own section is reapplied.
+        if section != "keystrokes":
+            return
+        if "width" in changes or "height" in changes:
+            try:
+                self.window.geometry(f"{int(self.config.get('width', 210))}x{int(self.config.get('height', 270))}")
+            except (ValueError, TypeError, tk.TclError):
+                pass
+        if "x" in changes or "y" in changes:
+            try:
+                self.window.geometry(f"+{int(self.config.get('x', 10))}+{int(self.config.get('y', 10))}")
+            except (ValueError, TypeError, tk.TclError):
+                pass
+        if "layout" in changes:
+            self.pressed_keys.clear()
+            self.build_layout()
+            self.renderer.invalidate()
+            if self.key_hook is not None:
+                self.hook_new_keys()
+                if self.key_hook == "hook" and self.mouse_slots:
+                    start_mouse_hook(self.bus)
+        if "enabled" in changes:
+            self.enabled = changes["enabled"]
+            self.update_visibility()
+
+    def on_key(self, t, code, down):
+        self.key_events += 1
+        slot = self.slots.get(code)
+        if slot is not None:
+            self.set_pressed(t, slot, down)
+
+    def on_mouse(self, t, code, down):
+        self.mouse_events += 1
+        slot = self.mouse_slots.get(code)
+        if slot is not None:
+            self.set_pressed(t, slot, down)
+
+    def set_pressed(self, t, slot, down):
+        if self.pressed[slot] == down:
+            return
+        self.pressed[slot] = down
+        self.keystats.record(t, self.stat_keys[slot], down)
+        if down:
+            self.pressed_keys.add(self.names[slot])
+        else:
+            self.pressed_keys.discard(self.names[slot])
+        self.renderer.fill(self.rects[slot], "#4a86e8" if down else "#333333")
+        if self.tracer is not None:
+            if not self.trace_pending:
+                # Idle callbacks run after the canvas redraw queued by itemconfigure.
+                self.window.after_idle(self.trace_rendered)
+            self.trace_pending.append(t)
+
+    def trace_rendered(self):
+        now = perf_counter_ns()
+        for t in self.trace_pending:
+            self.tracer.record("key_render", t, now)
+        self.trace_pending.clear()
+
+    def metrics(self):
+        yield "input_events_total", {"overlay": "keystrokes", "hook": "keyboard"}, self.key_events
+        yield "input_events_total", {"overlay": "keystrokes", "hook": "mouse"}, self.mouse_events
+        stats = self.keystats
+        for index, name in enumerate(stats.names):
+            yield "key_presses_total", {"key": name}, stats.presses[index]
+        yield "strafe_switches_total", {}, stats.switches
+        yield "render_calls_total", {"overlay": "keystrokes", "result": "issued"}, self.renderer.issued
+        yield "render_calls_total", {"overlay": "keystrokes", "result": "skipped"}, self.renderer.skipped
+
+    def print_summary(self, event=None):
+        print(self.keystats.format_summary(), file=sys.stderr)
+
+    def stop(self):
+        if self.config.get("summary_at_exit", True) and self.keystats.total:
+            self.print_summary()
 
     def update_key_visual(self, key, is_pressed):
-        tag = f"{key}_key"
-        if is_pressed:
-            self.canvas.itemconfig(tag, fill="#4a86e8")
-        else:
-            self.canvas.itemconfig(tag, fill="#333333")
+        slot = self.slots.get(key)
+        if slot is not None:
+            self.set_pressed(perf_counter_ns(), slot, is_pressed)
 
     def start_drag(self, event):
         self.drag_data["x"] = event.x_root - self.window.winfo_x()
@@ -158,237 +270,5 @@ class KeystrokeOverlay:
         else:
             self.window.withdraw()
 
-class OverlayApp:
-    def __init__(self, window):
-        self.window = window
-        self.window.title("Overlay App")
-        self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.config_path = os.path.join(self.script_dir, "packdisplay.json")
-        self.config = self.load_config()
-        self.enabled = self.config.get("enabled", True)
-        self.window.attributes("-topmost", True)
-        self.window.attributes("-alpha", 0.9)
-        self.window.overrideredirect(True)
-        x, y = self.config["x"], self.config["y"]
-        self.frame = ttk.Frame(self.window, style="Overlay.TFrame")
-        self.frame.pack(fill="both", expand=True)
-        style = ttk.Style()
-        style.configure("Overlay.TFrame", background="#212121")
-        self.inner_frame = ttk.Frame(self.frame, style="Overlay.TFrame")
-        self.inner_frame.pack(pady=10)
-        try:
-            self.pack_image = tk.PhotoImage(file=os.path.join(self.script_dir, "pack.png"))
-            self.image_label = ttk.Label(self.inner_frame, image=self.pack_image, background="#212121")
-            self.image_label.pack(side='left', padx=(0,5))
-        except tk.TclError:
-            pass
-        self.text_label = ttk.Label(
-            self.inner_frame,
-            text="Qomic 16x (Mashup)",
-            font=("Inter", 14),
-            foreground="white",
-            background="#212121"
-        )
-        self.text_label.pack(side='left')
-        self.window.update_idletasks()
-        req_width = self.frame.winfo_reqwidth()
-        req_height = self.frame.winfo_reqheight()
-        try:
-            self.window.geometry(f"{req_width}x{req_height}+{int(x)}+{int(y)}")
-        except (ValueError, tk.TclError):
-            self.window.geometry(f"{req_width}x{req_height}+50+50")
-        self.frame.bind("<Button-1>", self.start_drag)
-        self.frame.bind("<B1-Motion>", self.on_drag)
-        self.frame.bind("<ButtonRelease-1>", self.stop_drag)
-        self.frame.bind("<Button-3>", self.toggle_visibility)
-        self.inner_frame.bind("<Button-1>", self.start_drag)
-        self.inner_frame.bind("<B1-Motion>", self.on_drag)
-        self.inner_frame.bind("<ButtonRelease-1>", self.stop_drag)
-        self.inner_frame.bind("<Button-3>", self.toggle_visibility)
-        if hasattr(self, 'image_label'):
-            self.image_label.bind("<Button-1>", self.start_drag)
-            self.image_label.bind("<B1-Motion>", self.on_drag)
-            self.image_label.bind("<ButtonRelease-1>", self.stop_drag)
-            self.image_label.bind("<Button-3>", self.toggle_visibility)
-        self.text_label.bind("<Button-1>", self.start_drag)
-        self.text_label.bind("<B1-Motion>", self.on_drag)
-        self.text_label.bind("<ButtonRelease-1>", self.stop_drag)
-        self.text_label.bind("<Button-3>", self.toggle_visibility)
-        self.drag_start_x = 0
-        self.drag_start_y = 0
-        self.update_visibility()
-
-    def load_config(self):
-        try:
-            if not os.path.exists(self.config_path):
-                default_config = {"x": 50, "y": 50, "enabled": True}
-                with open(self.config_path, "w") as f:
-                    json.dump(default_config, f, indent=4)
-                return default_config
-            with open(self.config_path, "r") as f:
-                data = json.load(f)
-                return {"x": data.get("x", 50), "y": data.get("y", 50), "enabled": data.get("enabled", True)}
-        except (json.JSONDecodeError, KeyError, IOError):
-            return {"x": 50, "y": 50, "enabled": True}
-
-    def save_config(self, x, y):
-        data = {"x": x, "y": y, "enabled": self.enabled}
-        try:
-            with open(self.config_path, "w") as f:
-                json.dump(data, f, indent=4)
-        except (IOError, PermissionError):
-            pass
-
-    def start_drag(self, event):
-        self.drag_start_x = event.x_root - self.window.winfo_x()
-        self.drag_start_y = event.y_root - self.window.winfo_y()
-
-    def on_drag(self, event):
-        x = event.x_root - self.drag_start_x
-        y = event.y_root - self.drag_start_y
-        self.window.geometry(f"+{x}+{y}")
-
-    def stop_drag(self, event):
-        x = self.window.winfo_x()
-        y = self.window.winfo_y()
-        self.save_config(x, y)
-
-    def toggle_visibility(self, event):
-        self.enabled = not self.enabled
-        self.update_visibility()
-        self.save_config(self.window.winfo_x(), self.window.winfo_y())
-
-    def update_visibility(self):
-        if self.enabled:
-            self.window.deiconify()
-        else:
-            self.window.withdraw()
-
-class CPSOverlay:
-    def __init__(self, window):
-        self.window = window
-        self.window.title("CPS Overlay")
-        self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.config_path = os.path.join(self.script_dir, "config.json")
-        self.config = self.load_config()
-        self.enabled = self.config.get("enabled", True)
-        initial_x = self.config.get("x", 0)
-        initial_y = self.config.get("y", 0)
-        try:
-            self.window.geometry(f"140x40+{int(initial_x)}+{int(initial_y)}")
-        except (ValueError, tk.TclError):
-            self.window.geometry("140x40+0+0")
-        self.window.attributes('-topmost', True)
-        self.window.attributes('-alpha', 0.9)
-        self.window.overrideredirect(True)
-        self.left_click_times = []
-        self.right_click_times = []
-        self.left_cps = 0.0
-        self.right_cps = 0.0
-        self.canvas = tk.Canvas(self.window, bg='#212121', highlightthickness=0)
-        self.canvas.pack(fill='both', expand=True)
-        self.canvas.create_oval(0, 0, 28, 28, fill='#212121', outline='#212121')
-        self.canvas.create_oval(152, 0, 180, 28, fill='#212121', outline='#212121')
-        self.canvas.create_oval(0, 12, 28, 40, fill='#212121', outline='#212121')
-        self.canvas.create_oval(152, 12, 180, 40, fill='#212121', outline='#212121')
-        self.canvas.create_rectangle(14, 0, 166, 40, fill='#212121', outline='#212121')
-        self.canvas.create_rectangle(0, 14, 180, 26, fill='#212121', outline='#212121')
-        try:
-            self.label = self.canvas.create_text(70, 20, text="CPS: 0-0", font=("Inter", 12, "bold"), fill="white")
-        except tk.TclError:
-            self.label = self.canvas.create_text(70, 20, text="CPS: 0-0", font=("Courier New", 12, "bold"), fill="white")
-        self.canvas.bind("<Button-1>", self.start_drag)
-        self.canvas.bind("<B1-Motion>", self.on_drag)
-        self.canvas.bind("<ButtonRelease-1>", self.stop_drag)
-        self.canvas.bind("<Button-3>", self.toggle_visibility)
-        self.drag_data = {"x": 0, "y": 0}
-        self.start_mouse_listener()
-        self.update_cps()
-        self.update_visibility()
-
-    def load_config(self):
-        try:
-            if not os.path.exists(self.config_path):
-                default_config = {"x": 0, "y": 0, "enabled": True}
-                with open(self.config_path, 'w') as f:
-                    json.dump(default_config, f, indent=4)
-                return default_config
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError, PermissionError):
-            return {"x": 0, "y": 0, "enabled": True}
-
-    def save_config(self, x, y):
-        self.config["x"] = x
-        self.config["y"] = y
-        self.config["enabled"] = self.enabled
-        try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
-        except (IOError, PermissionError):
-            pass
-
-    def start_mouse_listener(self):
-        def on_click(x, y, button, pressed):
-            if pressed:
-                if button == mouse.Button.left:
-                    self.left_click_times.append(time())
-                elif button == mouse.Button.right:
-                    self.right_click_times.append(time())
-        listener = mouse.Listener(on_click=on_click)
-        listener_thread = threading.Thread(target=listener.start, daemon=True)
-        listener_thread.start()
-
-    def start_drag(self, event):
-        self.drag_data["x"] = event.x
-        self.drag_data["y"] = event.y
-
-    def on_drag(self, event):
-        x = event.x_root - self.drag_data["x"]
-        y = event.y_root - self.drag_data["y"]
-        self.window.geometry(f"+{x}+{y}")
-
-    def stop_drag(self, event):
-        x = self.window.winfo_x()
-        y = self.window.winfo_y()
-        self.save_config(x, y)
-        self.drag_data["x"] = 0
-        self.drag_data["y"] = 0
-
-    def update_cps(self):
-        if self.enabled:
-            current_time = time()
-            self.left_click_times = [t for t in self.left_click_times if current_time - t <= 1.0]
-            self.right_click_times = [t for t in self.right_click_times if current_time - t <= 1.0]
-            self.left_cps = len(self.left_click_times) / 1.0 if self.left_click_times else 0.0
-            self.right_cps = len(self.right_click_times) / 1.0 if self.right_click_times else 0.0
-            cps_str = f"{int(self.left_cps)}-{int(self.right_cps)}"
-            self.canvas.itemconfig(self.label, text=f"CPS: {cps_str}")
-        self.window.after(10, self.update_cps)
-
-    def toggle_visibility(self, event):
-        self.enabled = not self.enabled
-        self.update_visibility()
-        self.save_config(self.window.winfo_x(), self.window.winfo_y())
-
-    def update_visibility(self):
-        if self.enabled:
-            self.window.deiconify()
-        else:
-            self.window.withdraw()
-
-if __name__ == "__main__" and key == "oceanv1ontop":
-    root = tk.Tk()
-    root.withdraw()
-    overlay_app_window = tk.Toplevel(root)
-    overlay_app_window.attributes('-topmost', True)
-    overlay_app = OverlayApp(overlay_app_window)
-    cps_overlay_window = tk.Toplevel(root)
-    cps_overlay_window.attributes('-topmost', True)
-    cps_overlay = CPSOverlay(cps_overlay_window)
-    keystroke_overlay_window = tk.Toplevel(root)
-    keystroke_overlay_window.attributes('-topmost', True)
-    keystroke_overlay = KeystrokeOverlay(keystroke_overlay_window)
-    root.mainloop()
-elif key != "oceanv1ontop":
-    print("Your key is invalid. Please get a key at discord.gg/PQdr94S2Ja")
\ No newline at end of file
+def start(app):
+    return KeystrokeOverlay(app.toplevel(), app.bus, app.store, app.listen)
@@ -0,0 +1,194 @@
+import os
+import base64
+import tkinter as tk
+from tkinter import ttk
+from config_store import shared_store
+from packs import PackIndex, INDEX_FILE, active_pack, minecraft_dir
+from eventbus import CONFIG
+
+LEGACY_LABEL = "Qomic 16x (Mashup)"
+
+class OverlayApp:
+    def __init__(self, window, store=None, bus=None):
+        self.window = window
+        self.window.title("Overlay App")
+        self.script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.store = store or shared_store(self.script_dir)
+        self.config = self.store.section("packdisplay")
+        self.enabled = self.config.get("enabled", True)
+        self.window.attributes("-topmost", True)
+        self.window.attributes("-alpha", 0.9)
+        self.window.overrideredirect(True)
+        x, y = self.config["x"], self.config["y"]
+        self.frame = ttk.Frame(self.window, style="Overlay.TFrame")
+        self.frame.pack(fill="both", expand=True)
+        style = ttk.Style()
+        style.configure("Overlay.TFrame", background="#212121")
+        self.inner_frame = ttk.Frame(self.frame, style="Overlay.TFrame")
+        self.inner_frame.pack(pady=10)
+        self.index = PackIndex(os.path.join(self.script_dir, INDEX_FILE), self.scale_icon)
+        self.images = {}
+        self.packs = None
+        self.pack = self.find_active_pack()
+        self.pack_image = self.pack_photo(self.pack) if self.pack else None
+        if self.pack is None:
+            try:
+                self.pack_image = tk.PhotoImage(file=os.path.join(self.script_dir, "pack.png"))
+            except tk.TclError:
+                pass
+        self.image_label = ttk.Label(self.inner_frame, image=self.pack_image or "", background="#212121")
+        self.image_label.pack(side='left', padx=(0,5))
+        self.text_label = ttk.Label(
+            self.inner_frame,
+            text=self.pack["name"] if self.pack else LEGACY_LABEL,
+            font=("Inter", 14),
+            foreground="white",
+            background="#212121"
+        )
+        self.text_label.pack(side='left')
+        self.index.save(background=True)
+        self.window.update_idletasks()
+        req_width = self.frame.winfo_reqwidth()
+        req_height = self.frame.winfo_reqheight()
+        try:
+            self.window.geometry(f"{req_width}x{req_height}+{int(x)}+{int(y)}")
+        except (ValueError, tk.TclError):
+            self.window.geometry(f"{req_width}x{req_height}+50+50")
+        self.frame.bind("<Button-1>", self.start_drag)
+        self.frame.bind("<B1-Motion>", self.on_drag)
+        self.frame.bind("<ButtonRelease-1>", self.stop_drag)
+        self.frame.bind("<Button-3>", self.toggle_visibility)
+        self.inner_frame.bind("<Button-1>", self.start_drag)
+        self.inner_frame.bind("<B1-Motion>", self.on_drag)
+        self.inner_frame.bind("<ButtonRelease-1>", self.stop_drag)
+        self.inner_frame.bind("<Button-3>", self.toggle_visibility)
+        self.image_label.bind("<Button-1>", self.start_drag)
+        self.image_label.bind("<B1-Motion>", self.on_drag)
+        self.image_label.bind("<ButtonRelease-1>", self.stop_drag)
+        self.image_label.bind("<Button-3>", self.toggle_visibility)
+        self.text_label.bind("<Button-1>", self.start_drag)
+        self.text_label.bind("<B1-Motion>", self.on_drag)
+        self.text_label.bind("<ButtonRelease-1>", self.stop_drag)
+        self.text_label.bind("<Button-3>", self.toggle_visibility)
+        for widget in (self.frame, self.inner_frame, self.image_label, self.text_label):
+            widget.bind("<Button-2>", self.next_pack)
+        self.drag_start_x = 0
+        self.drag_start_y = 0
+        if bus is not None:
+            bus.subscribe(CONFIG, self.on_config)
+        self.update_visibility()
+
+    def on_config(self, t, section, changes):
+        if section != "packdisplay":
+            return
+        if "x" in changes or "y" in changes:
+            try:
+                self.window.geometry(f"+{int(self.config['x'])}+{int(self.config['y'])}")
+            except (ValueError, tk.TclError):
+                pass
+        if "packs_dir" in changes or "icon_size" in changes:
+            self.packs = None
+        if "icon_size" in changes:
+            self.images.clear()
+        if changes.keys() & {"pack", "packs_dir", "icon_size", "options"}:
+            pack = self.find_active_pack()
+            if pack is not None and pack is not self.pack:
+                self.show_pack(pack)
+            self.index.save(background=True)
+        if "enabled" in changes:
+            self.enabled = changes["enabled"]
+            self.update_visibility()
+
+    def packs_dir(self):
+        return self.config.get("packs_dir") or os.path.join(minecraft_dir(), "resourcepacks")
+
+    def find_active_pack(self):
+        # Only the shown pack is looked up at startup; the full scan waits for a switch.
+        name = self.config.get("pack") or active_pack(
+            self.config.get("options") or os.path.join(minecraft_dir(), "options.txt")
+        )
+        if not name:
+            return None
+        return self.index.get(os.path.join(self.packs_dir(), name), self.icon_size())
+
+    def icon_size(self):
+        try:
+            return max(1, int(self.config.get("icon_size", 32)))
+        except (ValueError, TypeError):
+            return 32
+
+    def scale_icon(self, data, size):
+        # Only on an index miss: the index keeps the small PNG, so later starts parse
+        # a few hundred bytes per pack instead of the full-size pack.png.
+        try:
+            image = tk.PhotoImage(data=base64.b64encode(data).decode("ascii"))
+            factor = -(-max(image.width(), image.height()) // size)
+            if factor > 1:
+                image = image.subsample(factor)
+            png = image.tk.call(image, "data", "-format", "png")
+        except tk.TclError:
+            return None
+        if isinstance(png, bytes):
+            png = base64.b64encode(png).decode("ascii")
+        return png
+
+    def pack_photo(self, pack):
+        image = self.images.get(pack["path"])
+        if image is None and pack.get("icon"):
+            try:
+                image = tk.PhotoImage(data=pack["icon"])
+            except tk.TclError:
+                return None
+            self.images[pack["path"]] = image
+        return image
+
+    def next_pack(self, event=None):
+        if self.packs is None:
+            self.packs = self.index.scan(self.packs_dir(), self.icon_size())
+            self.index.save(background=True)
+        if not self.packs:
+            return
+        paths = [pack["path"] for pack in self.packs]
+        current = paths.index(self.pack["path"]) if self.pack and self.pack["path"] in paths else -1
+        self.show_pack(self.packs[(current + 1) % len(self.packs)])
+
+    def show_pack(self, pack):
+        # Icons come from the index, and each PhotoImage is built once, so switching never reads disk.
+        self.pack = pack
+        self.pack_image = self.pack_photo(pack)
+        self.image_label.configure(image=self.pack_image or "")
+        self.text_label.configure(text=pack["name"])
+        self.window.update_idletasks()
+        self.window.geometry(f"{self.frame.winfo_reqwidth()}x{self.frame.winfo_reqheight()}")
+        self.store.update("packdisplay", pack=os.path.basename(pack["path"]))
+
+    def save_config(self, x, y):
+        self.store.update("packdisplay", x=x, y=y, enabled=self.enabled)
+
+    def start_drag(self, event):
+        self.drag_start_x = event.x_root - self.window.winfo_x()
+        self.drag_start_y = event.y_root - self.window.winfo_y()
+
+    def on_drag(self, event):
+        x = event.x_root - self.drag_start_x
+        y = event.y_root - self.drag_start_y
+        self.window.geometry(f"+{x}+{y}")
+
+    def stop_drag(self, event):
+        x = self.window.winfo_x()
+        y = self.window.winfo_y()
+        self.save_config(x, y)
+
+    def toggle_visibility(self, event):
+        self.enabled = not self.enabled
+        self.update_visibility()
+        self.save_config(self.window.winfo_x(), self.window.winfo_y())
+
+    def update_visibility(self):
+        if self.enabled:
+            self.window.deiconify()
+        else:
+            self.window.withdraw()
+
+def start(app):
+    return OverlayApp(app.toplevel(), app.store, app.bus)
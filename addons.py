@@ -0,0 +1,79 @@
+import os
+import json
+import importlib
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Addons")
+MANIFEST_SUFFIX = ".addon.json"
+NEEDS = ("tk", "input_hook", "thread")
+
+
+class AddonSpec:
+    def __init__(self, name, module, entry="start", needs=(), enabled=True, description="", path=None):
+        unknown = set(needs) - set(NEEDS)
+        if unknown:
+            raise ValueError(f"addon {name!r} declares unknown needs: {', '.join(sorted(unknown))}")
+        self.name = name
+        self.module = module
+        self.entry = entry
+        self.needs = frozenset(needs)
+        self.enabled = enabled
+        self.description = description
+        self.path = path
+
+    @classmethod
+    def from_manifest(cls, path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        return cls(
+            data["name"],
+            data["module"],
+            data.get("entry", "start"),
+            data.get("needs", ()),
+            data.get("enabled", True),
+            data.get("description", ""),
+            path,
+        )
+
+    def load(self):
+        return getattr(importlib.import_module(self.module), self.entry)
+
+
+class AddonRegistry:
+    def __init__(self, directory=ADDON_DIR):
+        self.directory = directory
+        self.specs = {}
+        self.errors = {}
+        self.discover()
+
+    def discover(self):
+        # Only manifests are read here; no addon module is imported until it is started.
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError:
+            names = []
+        for filename in names:
+            if not filename.endswith(MANIFEST_SUFFIX):
+                continue
+            path = os.path.join(self.directory, filename)
+            try:
+                spec = AddonSpec.from_manifest(path)
+            except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
+                self.errors[filename] = str(e)
+                continue
+            self.specs[spec.name] = spec
+
+    def enabled(self, overrides=None, only=None):
+        overrides = overrides or {}
+        if only is not None:
+            unknown = [name for name in only if name not in self.specs]
+            if unknown:
+                raise ValueError(f"unknown addons: {', '.join(unknown)}")
+            return [self.specs[name] for name in only]
+        return [spec for spec in self.specs.values() if overrides.get(spec.name, spec.enabled)]
+
+
+def required_needs(specs):
+    needs = set()
+    for spec in specs:
+        needs |= spec.needs
+    return needs
@@ -0,0 +1,61 @@
+import os
+from time import perf_counter_ns
+import pygame
+
+
+class HitSoundPlayer:
+    def __init__(self, path, channels=4, buffer=256, frequency=44100):
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        # Small buffers trade a little CPU for much less queueing delay before audio starts.
+        pygame.mixer.pre_init(frequency, -16, 2, buffer)
+        pygame.mixer.init()
+        self.sound = pygame.mixer.Sound(path)
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels))
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.next_channel = 0
+        self.plays = 0
+        self.last_latency_ns = 0
+
+    def play(self):
+        start = perf_counter_ns()
+        channel = self.channels[self.next_channel]
+        self.next_channel = (self.next_channel + 1) % len(self.channels)
+        # Round-robin reuses the oldest channel, so rapid hits overlap instead of cutting off.
+        channel.play(self.sound)
+        self.plays += 1
+        self.last_latency_ns = perf_counter_ns() - start
+        return self.last_latency_ns
+
+    def close(self):
+        for channel in self.channels:
+            channel.stop()
+        pygame.mixer.quit()
+
+
+def measure_trigger_latency(player, plays=500):
+    samples = sorted(player.play() for _ in range(plays))
+    return {
+        "plays": plays,
+        "p50_us": samples[len(samples) // 2] / 1000,
+        "p99_us": samples[int(len(samples) * 0.99)] / 1000,
+        "max_us": samples[-1] / 1000,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    parser = argparse.ArgumentParser(description="Measure hit sound trigger latency")
+    parser.add_argument("--sound", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "hit.mp3"))
+    parser.add_argument("--buffer", type=int, default=256)
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--plays", type=int, default=500)
+    args = parser.parse_args()
+    player = HitSoundPlayer(args.sound, args.channels, args.buffer)
+    try:
+        for k, v in measure_trigger_latency(player, args.plays).items():
+            print(f"{k}: {v:.1f}" if isinstance(v, float) else f"{k}: {v}")
+    finally:
+        player.close()
@@ -0,0 +1,298 @@
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from time import perf_counter, perf_counter_ns, sleep, strftime
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def percentiles(samples_ns):
+    samples = sorted(samples_ns)
+    if not samples:
+        return {}
+    return {
+        "mean_us": sum(samples) / len(samples) / 1000,
+        "p50_us": samples[len(samples) // 2] / 1000,
+        "p99_us": samples[int(len(samples) * 0.99)] / 1000,
+        "max_us": samples[-1] / 1000,
+    }
+
+
+def bench_detector(frames):
+    from frames import SyntheticSource, benchmark_detection
+    results = {"center_pixel": benchmark_detection(SyntheticSource(), frames)}
+    try:
+        from classifier import create_classifier
+        from config_store import DEFAULTS
+    except ImportError:
+        pass
+    else:
+        source = SyntheticSource()
+        classifier = create_classifier(source, DEFAULTS["classifier"])
+        start = perf_counter()
+        for _ in range(frames):
+            source.grab()
+            classifier.classify()
+        results["classifier"] = {"checks_per_second": frames / (perf_counter() - start)}
+    if os.environ.get("DISPLAY"):
+        from capture import ShmCapture, measure_rate
+        try:
+            with ShmCapture() as shm:
+                results["x11_shm"] = {"captures_per_second": measure_rate(shm, 1.0)}
+        except OSError as e:
+            results["x11_shm"] = {"error": str(e)}
+    return results
+
+
+def bench_cps(root, store, rates, ticks):
+    import tkinter as tk
+    from Addons.cps import CPSOverlay
+    overlay = CPSOverlay(tk.Toplevel(root), store=store, listen=False)
+    results = {}
+    for rate in rates:
+        overlay.left_clicks.clear()
+        overlay.right_clicks.clear()
+        now = perf_counter_ns()
+        step = 10_000_000
+        interval = 1_000_000_000 // rate if rate else 0
+        next_click = now
+        samples = []
+        for _ in range(ticks):
+            now += step
+            while interval and next_click <= now:
+                overlay.left_clicks.add(next_click)
+                overlay.right_clicks.add(next_click)
+                next_click += interval
+            start = perf_counter_ns()
+            overlay.refresh(now)
+            samples.append(perf_counter_ns() - start)
+        root.update_idletasks()
+        results[f"{rate}_cps"] = percentiles(samples)
+    results["render"] = overlay.renderer.stats()
+    overlay.window.destroy()
+    return results
+
+
+def bench_keys(root, store, events, layout=None):
+    import tkinter as tk
+    from Addons.keystrokes import KeystrokeOverlay
+    from eventbus import KEYBOARD
+    section = store.section("keystrokes")
+    previous = section.pop("layout", None)
+    if layout is not None:
+        section["layout"] = layout
+    try:
+        overlay = KeystrokeOverlay(tk.Toplevel(root), store=store, listen=False)
+    finally:
+        section.pop("layout", None)
+        if previous is not None:
+            section["layout"] = previous
+    bus = overlay.bus
+    bus.stop()
+    keys = list(overlay.slots)
+    samples = []
+    for i in range(events):
+        key = keys[i % len(keys)]
+        start = perf_counter_ns()
+        bus.post(KEYBOARD, key, True, start)
+        bus.drain()
+        root.update_idletasks()
+        bus.post(KEYBOARD, key, False)
+        bus.drain()
+        root.update_idletasks()
+        samples.append(perf_counter_ns() - start)
+    overlay.window.destroy()
+    result = percentiles(samples)
+    result["events"] = events * 2
+    return result
+
+
+def bench_detector_contention(root, store, events, target_hz):
+    import copy
+    from config_store import DEFAULTS
+    from Addons.hitsound import DetectorThread, DetectorProcess
+    config = {name: copy.deepcopy(DEFAULTS[name]) for name in ("audio", "detector", "classifier")}
+    # A near-busy synthetic detector reproduces the old spin loop's pressure on the GIL.
+    config["detector"].update(source="synthetic", target_hz=target_hz, idle_hz=target_hz)
+    results = {"none": bench_keys(root, store, events)}
+    for name, cls in (("thread", DetectorThread), ("process", DetectorProcess)):
+        detector = cls(config).start()
+        sleep(1.0)
+        try:
+            results[name] = bench_keys(root, store, events)
+            results[name]["detector"] = detector.snapshot()
+        finally:
+            detector.stop()
+    return results
+
+
+def bench_startup(repeats):
+    from main import build_app
+    from config_store import ConfigStore
+    samples = []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = perf_counter_ns()
+            app = build_app(ConfigStore(tmp), ["packdisplay", "cps", "keystrokes"], listen=False)
+            app.root.update()
+            samples.append(perf_counter_ns() - start)
+            app.root.destroy()
+    code = (
+        "import time; t = time.perf_counter(); import main, Addons.cps, Addons.keystrokes, Addons.packdisplay; "
+        "print(time.perf_counter() - t)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=SCRIPT_DIR, capture_output=True, text=True, env=os.environ,
+    )
+    result = {"build_app": percentiles(samples)}
+    try:
+        result["import_ms"] = float(out.stdout.strip().splitlines()[-1]) * 1000
+    except (ValueError, IndexError):
+        result["import_error"] = out.stderr.strip().splitlines()[-1:] or "no output"
+    return result
+
+
+def bench_compositor(frames):
+    import tkinter as tk
+    from main import build_app
+    from config_store import ConfigStore
+    results = {}
+    for name, enabled in (("windows", False), ("compositor", True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ConfigStore(tmp)
+            store.section("compositor")["enabled"] = enabled
+            start = perf_counter_ns()
+            app = build_app(store, ["packdisplay", "cps", "keystrokes"], listen=False)
+            app.root.update()
+            startup = perf_counter_ns() - start
+            keys = app.addons["keystrokes"]
+            samples = []
+            for i in range(frames):
+                keys.update_key_visual("w", i % 2 == 0)
+                start = perf_counter_ns()
+                app.root.update()
+                samples.append(perf_counter_ns() - start)
+            toplevels = [w for w in app.root.winfo_children() if isinstance(w, tk.Toplevel)]
+            results[name] = {
+                "toplevels": len(toplevels),
+                "startup_us": startup / 1000,
+                "frame": percentiles(samples),
+            }
+            app.root.destroy()
+    return results
+
+
+def start_xvfb(display=":99"):
+    if not shutil.which("Xvfb"):
+        sys.exit("Xvfb not found on PATH")
+    proc = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    os.environ["DISPLAY"] = display
+    sleep(0.5)
+    return proc
+
+
+# Which way each measured field regresses, by key suffix. Anything else (counts such
+# as hits_detected or events, configured rates, cumulative totals) is context only.
+HIGHER_IS_BETTER = ("per_second", "achieved_hz", "rate_hz")
+LOWER_IS_BETTER = ("_us", "_ms", "cpu_percent", "hits_missed", "latency_frames_max", "latency_frames_mean")
+
+
+def direction(key):
+    if key.endswith(HIGHER_IS_BETTER):
+        return 1
+    if key.endswith(LOWER_IS_BETTER) and "total" not in key:
+        return -1
+    return 0
+
+
+def compare(current, baseline, threshold):
+    regressions = []
+
+    def walk(cur, base, path):
+        for key, value in cur.items():
+            old = base.get(key) if isinstance(base, dict) else None
+            name = f"{path}.{key}" if path else key
+            if isinstance(value, dict):
+                walk(value, old or {}, name)
+            elif isinstance(value, (int, float)) and isinstance(old, (int, float)) and old:
+                sign = direction(key)
+                change = (value - old) / old
+                if sign and -sign * change > threshold:
+                    regressions.append((name, old, value, change))
+
+    walk(current, baseline, "")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless OceanClient benchmarks")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="previous results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.15, help="relative change counted as a regression")
+    parser.add_argument("--xvfb", action="store_true", help="start a private Xvfb server for the Tk benchmarks")
+    parser.add_argument("--frames", type=int, default=200_000)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--detector-hz", type=int, default=5000, help="detector rate for the GIL contention run")
+    args = parser.parse_args()
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        results = {"detector": bench_detector(args.frames)}
+        if os.environ.get("DISPLAY"):
+            import tkinter as tk
+            from config_store import ConfigStore
+            with tempfile.TemporaryDirectory() as tmp:
+                root = tk.Tk()
+                root.withdraw()
+                store = ConfigStore(tmp)
+                results["cps_update"] = bench_cps(root, store, (0, 10, 20, 50, 100), args.ticks)
+                results["key_to_render"] = bench_keys(root, store, args.events)
+                layout = [
+                    {"key": key, "x": 30 + 45 * (i % 5), "y": 30 + 45 * (i // 5), "w": 40}
+                    for i, key in enumerate(list("1234qwertasdfgzxcvb") + ["space"])
+                ]
+                results["key_to_render_20"] = bench_keys(root, store, args.events, layout)
+                results["detector_contention"] = bench_detector_contention(
+                    root, store, args.events, args.detector_hz
+                )
+                root.destroy()
+            results["startup"] = bench_startup(args.repeats)
+            results["compositor"] = bench_compositor(args.ticks)
+        else:
+            print("DISPLAY not set; skipping Tk benchmarks (use --xvfb)", file=sys.stderr)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    report = {
+        "timestamp": strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(json.dumps(results, indent=4))
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name}: {old:.2f} -> {new:.2f} ({change:+.0%})", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import sys
+import ctypes
+import ctypes.util
+from time import perf_counter
+from frames import FrameSource
+
+IPC_PRIVATE = 0
+IPC_CREAT = 0o1000
+IPC_RMID = 0
+ZPIXMAP = 2
+ALL_PLANES = 0xFFFFFFFF
+
+
+class XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ("shmseg", ctypes.c_ulong),
+        ("shmid", ctypes.c_int),
+        ("shmaddr", ctypes.c_void_p),
+        ("readOnly", ctypes.c_int),
+    ]
+
+
+class XErrorEvent(ctypes.Structure):
+    _fields_ = [
+        ("type", ctypes.c_int),
+        ("display", ctypes.c_void_p),
+        ("resourceid", ctypes.c_ulong),
+        ("serial", ctypes.c_ulong),
+        ("error_code", ctypes.c_ubyte),
+        ("request_code", ctypes.c_ubyte),
+        ("minor_code", ctypes.c_ubyte),
+    ]
+
+
+XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(XErrorEvent))
+# Set by _trap_error while a request we expect may fail is in flight; Xlib's default
+# handler would otherwise print the error and exit the whole process.
+_x_errors = []
+
+
+@XErrorHandler
+def _trap_error(display, event):
+    _x_errors.append(event.contents.error_code)
+    return 0
+
+
+class XImage(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("xoffset", ctypes.c_int),
+        ("format", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("byte_order", ctypes.c_int),
+        ("bitmap_unit", ctypes.c_int),
+        ("bitmap_bit_order", ctypes.c_int),
+        ("bitmap_pad", ctypes.c_int),
+        ("depth", ctypes.c_int),
+        ("bytes_per_line", ctypes.c_int),
+        ("bits_per_pixel", ctypes.c_int),
+    ]
+
+
+def _load_x11():
+    x11 = ctypes.CDLL(ctypes.util.find_library("X11") or "libX11.so.6")
+    xext = ctypes.CDLL(ctypes.util.find_library("Xext") or "libXext.so.6")
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    x11.XOpenDisplay.restype = ctypes.c_void_p
+    x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+    x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+    x11.XDefaultScreen.restype = ctypes.c_int
+    x11.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XRootWindow.restype = ctypes.c_ulong
+    x11.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XDefaultVisual.restype = ctypes.c_void_p
+    x11.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XDefaultDepth.restype = ctypes.c_int
+    x11.XDisplayWidth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XDisplayWidth.restype = ctypes.c_int
+    x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XDisplayHeight.restype = ctypes.c_int
+    x11.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    x11.XFree.argtypes = [ctypes.c_void_p]
+    x11.XSetErrorHandler.argtypes = [XErrorHandler]
+    x11.XSetErrorHandler.restype = XErrorHandler
+    xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+    xext.XShmQueryExtension.restype = ctypes.c_int
+    xext.XShmCreateImage.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+        ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo), ctypes.c_uint, ctypes.c_uint,
+    ]
+    xext.XShmCreateImage.restype = ctypes.POINTER(XImage)
+    xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+    xext.XShmAttach.restype = ctypes.c_int
+    xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+    xext.XShmGetImage.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.POINTER(XImage),
+        ctypes.c_int, ctypes.c_int, ctypes.c_ulong,
+    ]
+    xext.XShmGetImage.restype = ctypes.c_int
+    libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+    libc.shmget.restype = ctypes.c_int
+    libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+    libc.shmat.restype = ctypes.c_void_p
+    libc.shmdt.argtypes = [ctypes.c_void_p]
+    libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+    return x11, xext, libc
+
+
+class ShmCapture(FrameSource):
+    name = "x11-shm"
+
+    def __init__(self, width=16, height=16, center=None, display=None):
+        self.x11, self.xext, self.libc = _load_x11()
+        self.display = self.x11.XOpenDisplay(display.encode() if display else None)
+        if not self.display:
+            raise OSError("cannot open X display")
+        if not self.xext.XShmQueryExtension(self.display):
+            self.x11.XCloseDisplay(self.display)
+            raise OSError("X server does not support MIT-SHM")
+        screen = self.x11.XDefaultScreen(self.display)
+        self.root = self.x11.XRootWindow(self.display, screen)
+        self.screen_width = self.x11.XDisplayWidth(self.display, screen)
+        self.screen_height = self.x11.XDisplayHeight(self.display, screen)
+        if center is None:
+            center = (self.screen_width // 2, self.screen_height // 2)
+        self.width = width
+        self.height = height
+        self.left = max(0, min(center[0] - width // 2, self.screen_width - width))
+        self.top = max(0, min(center[1] - height // 2, self.screen_height - height))
+        self.shminfo = XShmSegmentInfo()
+        self.image = self.xext.XShmCreateImage(
+            self.display, self.x11.XDefaultVisual(self.display, screen),
+            self.x11.XDefaultDepth(self.display, screen), ZPIXMAP, None,
+            ctypes.byref(self.shminfo), width, height,
+        )
+        if not self.image:
+            self.x11.XCloseDisplay(self.display)
+            raise OSError("XShmCreateImage failed")
+        if self.image.contents.bits_per_pixel != 32:
+            self.x11.XFree(self.image)
+            self.x11.XCloseDisplay(self.display)
+            raise OSError("only 32 bpp visuals are supported")
+        self.stride = self.image.contents.bytes_per_line
+        size = self.stride * height
+        self.shminfo.shmid = self.libc.shmget(IPC_PRIVATE, size, IPC_CREAT | 0o600)
+        if self.shminfo.shmid < 0:
+            self.x11.XFree(self.image)
+            self.x11.XCloseDisplay(self.display)
+            raise OSError(ctypes.get_errno(), "shmget failed")
+        addr = self.libc.shmat(self.shminfo.shmid, None, 0)
+        if addr in (None, ctypes.c_void_p(-1).value):
+            self.libc.shmctl(self.shminfo.shmid, IPC_RMID, None)
+            self.x11.XFree(self.image)
+            self.x11.XCloseDisplay(self.display)
+            raise OSError(ctypes.get_errno(), "shmat failed")
+        self.shminfo.shmaddr = addr
+        self.shminfo.readOnly = 0
+        self.image.contents.data = addr
+        # Attaching fails on remote displays and in some sandboxes; the error only
+        # arrives with the XSync round trip.
+        del _x_errors[:]
+        previous = self.x11.XSetErrorHandler(_trap_error)
+        try:
+            attached = self.xext.XShmAttach(self.display, ctypes.byref(self.shminfo))
+            self.x11.XSync(self.display, 0)
+        finally:
+            self.x11.XSetErrorHandler(previous)
+        if not attached or _x_errors:
+            self.libc.shmdt(addr)
+            self.libc.shmctl(self.shminfo.shmid, IPC_RMID, None)
+            self.image.contents.data = None
+            self.x11.XFree(self.image)
+            self.x11.XCloseDisplay(self.display)
+            raise OSError(f"XShmAttach failed (X error {_x_errors[0] if _x_errors else 0})")
+        # Mark the segment for removal now so it is released even if we crash.
+        self.libc.shmctl(self.shminfo.shmid, IPC_RMID, None)
+        self.buffer = memoryview((ctypes.c_ubyte * size).from_address(addr)).cast("B")
+        self.center_offset = (height // 2) * self.stride + (width // 2) * 4
+
+    def grab(self):
+        return bool(self.xext.XShmGetImage(
+            self.display, self.root, self.image, self.left, self.top, ALL_PLANES
+        ))
+
+    def close(self):
+        if self.display is None:
+            return
+        self.buffer.release()
+        self.xext.XShmDetach(self.display, ctypes.byref(self.shminfo))
+        self.x11.XSync(self.display, 0)
+        self.image.contents.data = None
+        self.x11.XFree(self.image)
+        self.libc.shmdt(self.shminfo.shmaddr)
+        self.x11.XCloseDisplay(self.display)
+        self.display = None
+
+
+class PyAutoGuiCapture(FrameSource):
+    name = "pyautogui"
+
+    def __init__(self, width=1, height=1, center=None):
+        import pyautogui
+        self.pyautogui = pyautogui
+        self.screen_width, self.screen_height = pyautogui.size()
+        if center is None:
+            center = (self.screen_width // 2, self.screen_height // 2)
+        self.x, self.y = center
+        self.width = max(1, min(width, self.screen_width))
+        self.height = max(1, min(height, self.screen_height))
+        self.left = max(0, min(self.x - self.width // 2, self.screen_width - self.width))
+        self.top = max(0, min(self.y - self.height // 2, self.screen_height - self.height))
+        self.stride = self.width * 4
+        # Same BGRA layout as ShmCapture, so classifier masks work on this fallback too.
+        self.buffer = bytearray(self.stride * self.height)
+        self.center_offset = (self.height // 2) * self.stride + (self.width // 2) * 4
+
+    def grab(self):
+        if self.width == 1 and self.height == 1:
+            try:
+                r, g, b = self.pyautogui.pixel(self.x, self.y)[:3]
+            except Exception:
+                return False
+            buf = self.buffer
+            buf[0] = b
+            buf[1] = g
+            buf[2] = r
+            return True
+        try:
+            image = self.pyautogui.screenshot(region=(self.left, self.top, self.width, self.height))
+            rgb = image.convert("RGB").tobytes()
+        except Exception:
+            return False
+        if len(rgb) != self.width * self.height * 3:
+            return False
+        # Written in place: the classifier holds a view of this buffer.
+        buf = self.buffer
+        buf[0::4] = rgb[2::3]
+        buf[1::4] = rgb[1::3]
+        buf[2::4] = rgb[0::3]
+        return True
+
+
+def create_capture(width=16, height=16, center=None):
+    if sys.platform.startswith("linux"):
+        try:
+            return ShmCapture(width, height, center)
+        except OSError:
+            pass
+    return PyAutoGuiCapture(width, height, center)
+
+
+def measure_rate(capture, seconds=2.0):
+    grabs = 0
+    start = perf_counter()
+    end = start + seconds
+    now = start
+    while now < end:
+        capture.grab()
+        grabs += 1
+        now = perf_counter()
+    return grabs / (now - start)
+
+
+if __name__ == "__main__":
+    results = {}
+    try:
+        with ShmCapture() as shm:
+            results[shm.name] = measure_rate(shm)
+    except OSError as e:
+        print(f"x11-shm unavailable: {e}")
+    try:
+        with PyAutoGuiCapture() as pag:
+            results[pag.name] = measure_rate(pag)
+    except Exception as e:
+        print(f"pyautogui unavailable: {e}")
+    for name, rate in results.items():
+        print(f"{name}: {rate:.0f} captures/s")
+    if len(results) == 2:
+        print(f"speedup: {results['x11-shm'] / results['pyautogui']:.1f}x")
@@ -0,0 +1,113 @@
+import numpy as np
+
+DEFAULT_RULES = [{"space": "rgb", "min": [201, 0, 0], "max": [255, 49, 49]}]
+
+
+def mask_offsets(shape="square", radius=2, offsets=None):
+    if offsets is not None:
+        return [tuple(o) for o in offsets]
+    points = []
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            if shape == "cross" and dx and dy:
+                continue
+            if shape == "ring" and max(abs(dx), abs(dy)) != radius:
+                continue
+            points.append((dx, dy))
+    return points
+
+
+class HitClassifier:
+    def __init__(self, source, rules=None, mask=None, min_fraction=0.2, exit_fraction=None):
+        self.source = source
+        pixels = np.frombuffer(source.buffer, dtype=np.uint8)
+        pixels = pixels[:source.stride * source.height].reshape(source.height, source.stride // 4, 4)
+        self._rows = pixels
+        cx, cy = source.width // 2, source.height // 2
+        points = [
+            (cx + dx, cy + dy) for dx, dy in mask_offsets(**(mask or {}))
+            if 0 <= cx + dx < source.width and 0 <= cy + dy < source.height
+        ]
+        if not points:
+            points = [(cx, cy)]
+        self.ys = np.array([p[1] for p in points], dtype=np.intp)
+        self.xs = np.array([p[0] for p in points], dtype=np.intp)
+        self.count = len(points)
+        self.rules = []
+        for rule in rules or DEFAULT_RULES:
+            low = np.array(rule["min"], dtype=np.float32)
+            high = np.array(rule["max"], dtype=np.float32)
+            self.rules.append((rule.get("space", "rgb"), low, high))
+        self.needs_hsv = any(space == "hsv" for space, _, _ in self.rules)
+        self.min_fraction = min_fraction
+        self.exit_fraction = min_fraction / 2 if exit_fraction is None else exit_fraction
+        self.fraction = 0.0
+        self.active = False
+
+    def _match(self):
+        # Gather only the masked pixels, then test every rule in one vectorised pass.
+        bgr = self._rows[self.ys, self.xs, :3].astype(np.float32)
+        rgb = bgr[:, ::-1]
+        hsv = _rgb_to_hsv(rgb) if self.needs_hsv else None
+        matched = None
+        for space, low, high in self.rules:
+            values = hsv if space == "hsv" else rgb
+            if space == "hsv" and low[0] > high[0]:
+                # Hue range wraps through 0, e.g. 340..20 degrees for red.
+                hue = (values[:, 0] >= low[0]) | (values[:, 0] <= high[0])
+                ok = hue & np.all((values[:, 1:] >= low[1:]) & (values[:, 1:] <= high[1:]), axis=1)
+            else:
+                ok = np.all((values >= low) & (values <= high), axis=1)
+            matched = ok if matched is None else matched | ok
+        return int(np.count_nonzero(matched))
+
+    def classify(self):
+        self.fraction = self._match() / self.count
+        if self.active:
+            if self.fraction < self.exit_fraction:
+                self.active = False
+        elif self.fraction >= self.min_fraction:
+            self.active = True
+        return self.active
+
+
+def _rgb_to_hsv(rgb):
+    rgb = rgb / 255.0
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    v = rgb.max(axis=1)
+    c = v - rgb.min(axis=1)
+    safe_c = np.where(c == 0, 1.0, c)
+    h = np.where(v == r, ((g - b) / safe_c) % 6.0,
+                 np.where(v == g, (b - r) / safe_c + 2.0, (r - g) / safe_c + 4.0))
+    h = np.where(c == 0, 0.0, h * 60.0)
+    s = np.where(v == 0, 0.0, c / np.where(v == 0, 1.0, v))
+    return np.stack((h, s, v), axis=1)
+
+
+def create_classifier(source, config):
+    return HitClassifier(
+        source,
+        rules=config.get("rules"),
+        mask=config.get("mask"),
+        min_fraction=config.get("min_fraction", 0.2),
+        exit_fraction=config.get("exit_fraction"),
+    )
+
+
+if __name__ == "__main__":
+    from time import perf_counter_ns
+    from frames import SyntheticSource
+    source = SyntheticSource(32, 32, hit_rate=20.0)
+    for name, rules in (("rgb", None), ("hsv", [{"space": "hsv", "min": [340, 0.7, 0.7], "max": [20, 1, 1]}])):
+        # The synthetic hitmarker only covers the crosshair arms, ~3% of a 32x32 square.
+        classifier = HitClassifier(source, rules, {"shape": "square", "radius": 16}, min_fraction=0.02)
+        samples = []
+        hits = 0
+        for _ in range(5000):
+            source.grab()
+            start = perf_counter_ns()
+            hits += classifier.classify()
+            samples.append(perf_counter_ns() - start)
+        samples.sort()
+        print(f"{name} 32x32 ({classifier.count} px): p50 {samples[len(samples) // 2] / 1000:.1f} us, "
+              f"p99 {samples[int(len(samples) * 0.99)] / 1000:.1f} us, hit frames {hits}")
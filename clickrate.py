@@ -0,0 +1,112 @@
+import math
+from array import array
+from collections import deque
+from time import perf_counter_ns
+
+# Comfortably above any human click rate; bounds memory while the overlay is hidden.
+MAX_CPS = 128
+
+
+class ClickCounter:
+    def __init__(self, window=1.0, capacity=None):
+        self.window_ns = int(window * 1e9)
+        self.times = deque(maxlen=capacity or self._capacity_for(window))
+        self.peak = 0
+
+    @staticmethod
+    def _capacity_for(window):
+        return max(1, int(MAX_CPS * max(window, 1.0)))
+
+    def set_window(self, window):
+        self.window_ns = int(window * 1e9)
+        self.times = deque(self.times, maxlen=self._capacity_for(window))
+
+    def add(self, t=None):
+        # The deque's maxlen drops the oldest stamp, so memory stays bounded even if
+        # nobody calls count() for hours.
+        if t is None:
+            t = perf_counter_ns()
+        times = self.times
+        times.append(t)
+        # Each stamp is evicted at most once, so tracking the peak stays O(1) amortised.
+        cutoff = t - self.window_ns
+        while times[0] < cutoff:
+            times.popleft()
+        if len(times) > self.peak:
+            self.peak = len(times)
+
+    def count(self, now=None):
+        if now is None:
+            now = perf_counter_ns()
+        times = self.times
+        cutoff = now - self.window_ns
+        while times and times[0] < cutoff:
+            times.popleft()
+        return len(times)
+
+    def rate(self, now=None):
+        return self.count(now) * 1e9 / self.window_ns
+
+    def peak_rate(self):
+        return self.peak * 1e9 / self.window_ns
+
+    def clear(self):
+        self.times.clear()
+        self.peak = 0
+
+
+class ClickStats:
+    def __init__(self, double_click_ms=40, bucket_ms=10, buckets=50, max_interval_ms=1000):
+        self.double_click_ns = int(double_click_ms * 1e6)
+        self.bucket_ns = int(bucket_ms * 1e6)
+        self.max_interval_ns = int(max_interval_ms * 1e6)
+        # The last bucket collects everything from buckets * bucket_ms up to max_interval_ms.
+        self.histogram = array("I", bytes(4 * buckets))
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.histogram)):
+            self.histogram[i] = 0
+        self.clicks = 0
+        self.intervals = 0
+        self.double_clicks = 0
+        self.mean_ns = 0.0
+        self.m2 = 0.0
+        self.last = None
+
+    def add(self, t):
+        self.clicks += 1
+        last = self.last
+        self.last = t
+        if last is None:
+            return
+        interval = t - last
+        if interval > self.max_interval_ns:
+            # A pause ends the streak rather than counting as one very slow click.
+            return
+        if interval <= self.double_click_ns:
+            self.double_clicks += 1
+        bucket = interval // self.bucket_ns
+        histogram = self.histogram
+        histogram[bucket if bucket < len(histogram) else -1] += 1
+        # Welford's update: running mean and variance without keeping the intervals.
+        self.intervals = n = self.intervals + 1
+        delta = interval - self.mean_ns
+        self.mean_ns += delta / n
+        self.m2 += delta * (interval - self.mean_ns)
+
+    def stddev_ns(self):
+        if self.intervals < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.intervals - 1))
+
+    def snapshot(self):
+        return {
+            "clicks": self.clicks,
+            "intervals": self.intervals,
+            "double_clicks": self.double_clicks,
+            "mean_ms": self.mean_ns / 1e6,
+            "stddev_ms": self.stddev_ns() / 1e6,
+            "histogram_ms": self.bucket_ns / 1e6,
+            "histogram": list(self.histogram),
+        }
@@ -0,0 +1,123 @@
+import re
+import tkinter as tk
+
+GEOMETRY = re.compile(r"^(?:(\d+)x(\d+))?(?:([+-]-?\d+)([+-]-?\d+))?$")
+TRANSPARENT = "black"
+
+
+class Region(tk.Frame):
+    # Stands in for a Toplevel: overlays call the same wm methods on it, but it is
+    # drawn as a window item on the compositor's single canvas.
+    def __init__(self, compositor):
+        tk.Frame.__init__(self, compositor.canvas, bg=TRANSPARENT, highlightthickness=0, bd=0)
+        self.compositor = compositor
+        self.x = 0
+        self.y = 0
+        self.width = 0
+        self.height = 0
+        self.visible = True
+        self.item = compositor.canvas.create_window(0, 0, window=self, anchor="nw")
+
+    def title(self, *args):
+        pass
+
+    def attributes(self, *args):
+        pass
+
+    wm_attributes = attributes
+
+    def overrideredirect(self, *args):
+        pass
+
+    def geometry(self, spec=None):
+        if spec is None:
+            return f"{self.width}x{self.height}+{self.x}+{self.y}"
+        match = GEOMETRY.match(spec)
+        if not match:
+            raise tk.TclError(f'bad geometry specifier "{spec}"')
+        w, h, x, y = match.groups()
+        if w is not None:
+            self.width, self.height = int(w), int(h)
+            self.compositor.canvas.itemconfigure(self.item, width=self.width, height=self.height)
+        if x is not None:
+            # Tk writes negative offsets as +-N.
+            self.x, self.y = int(x.lstrip("+")), int(y.lstrip("+"))
+        self.compositor.layout()
+
+    def winfo_x(self):
+        return self.x
+
+    def winfo_y(self):
+        return self.y
+
+    def deiconify(self):
+        if not self.visible:
+            self.visible = True
+            self.compositor.layout()
+
+    def withdraw(self):
+        if self.visible:
+            self.visible = False
+            self.compositor.layout()
+
+    def extent(self):
+        return self.width or self.winfo_reqwidth(), self.height or self.winfo_reqheight()
+
+
+class Compositor:
+    def __init__(self, root):
+        self.root = root
+        self.window = tk.Toplevel(root)
+        self.window.title("Ocean Overlays")
+        self.window.overrideredirect(True)
+        self.window.attributes("-topmost", True)
+        try:
+            # Windows keys this colour out and passes clicks on it through to the game.
+            self.window.wm_attributes("-transparentcolor", TRANSPARENT)
+        except tk.TclError:
+            # Without it the shared window is one opaque black box over every overlay's
+            # bounding box, so the caller falls back to separate Toplevels.
+            self.window.destroy()
+            raise
+        self.canvas = tk.Canvas(self.window, bg=TRANSPARENT, highlightthickness=0, bd=0)
+        self.canvas.pack(fill="both", expand=True)
+        self.regions = []
+        self.origin = None
+        self.bounds = None
+        self._pending = False
+
+    def region(self):
+        region = Region(self)
+        self.regions.append(region)
+        return region
+
+    def layout(self):
+        # Coalesce the burst of geometry calls an overlay makes while it is built or dragged.
+        if not self._pending:
+            self._pending = True
+            self.window.after_idle(self.apply_layout)
+
+    def apply_layout(self):
+        self._pending = False
+        visible = [r for r in self.regions if r.visible]
+        if not visible:
+            self.bounds = None
+            self.window.withdraw()
+            return
+        sizes = [r.extent() for r in visible]
+        left = min(r.x for r in visible)
+        top = min(r.y for r in visible)
+        right = max(r.x + w for r, (w, _) in zip(visible, sizes))
+        bottom = max(r.y + h for r, (_, h) in zip(visible, sizes))
+        for region in self.regions:
+            if region.visible:
+                self.canvas.coords(region.item, region.x - left, region.y - top)
+                self.canvas.itemconfigure(region.item, state="normal")
+            else:
+                self.canvas.itemconfigure(region.item, state="hidden")
+        bounds = (right - left, bottom - top, left, top)
+        if bounds != self.bounds:
+            self.bounds = bounds
+            self.window.geometry("{}x{}+{}+{}".format(*bounds))
+        if self.window.state() == "withdrawn":
+            self.window.deiconify()
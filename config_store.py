@@ -0,0 +1,200 @@
+import os
+import copy
+import json
+import atexit
+import hashlib
+import threading
+from time import monotonic
+
+CONFIG_FILE = "ocean_config.json"
+
+DEFAULTS = {
+    "addons": {},
+    "packdisplay": {"x": 50, "y": 50, "enabled": True, "packs_dir": "", "pack": "", "icon_size": 32},
+    "cps": {"x": 0, "y": 0, "enabled": True},
+    "keystrokes": {"x": 10, "y": 10, "enabled": True},
+    "compositor": {"enabled": False},
+    "render": {"fps": 100},
+    "metrics": {"enabled": False, "host": "127.0.0.1", "port": 9465},
+    "hot_reload": {"enabled": True},
+    "audio": {"buffer": 256, "channels": 4},
+    "detector": {
+        "target_hz": 240, "idle_hz": 30, "region": 16, "mode": "thread", "source": "screen",
+        "cooldown_ms": 200,
+    },
+    "classifier": {
+        "rules": [{"space": "rgb", "min": [201, 0, 0], "max": [255, 49, 49]}],
+        "mask": {"shape": "cross", "radius": 2},
+        "min_fraction": 0.3,
+        "exit_fraction": 0.1,
+    },
+}
+
+LEGACY_FILES = {
+    "packdisplay": "packdisplay.json",
+    "cps": "config.json",
+    "keystrokes": "keystroke_config.json",
+}
+
+_stores = {}
+
+
+def shared_store(directory):
+    path = os.path.abspath(directory)
+    store = _stores.get(path)
+    if store is None:
+        store = _stores[path] = ConfigStore(path)
+    return store
+
+
+class ConfigStore:
+    def __init__(self, directory, filename=CONFIG_FILE, debounce=0.5, max_delay=2.0, read_only=False):
+        self.directory = directory
+        # A read-only store merges legacy files in memory but never writes anything.
+        self.read_only = read_only
+        self.path = os.path.join(directory, filename)
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.writes = 0
+        self.write_errors = 0
+        self.reloads = 0
+        self.echoes = 0
+        self.written_digest = None
+        self._dirty = False
+        self._closed = False
+        self._wake = threading.Event()
+        self._thread = None
+        self.data = self.load()
+        if self._dirty:
+            self._ensure_writer()
+            self._wake.set()
+
+    def load(self):
+        data = None
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = self._migrate()
+        except (json.JSONDecodeError, OSError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        for name, defaults in DEFAULTS.items():
+            section = data.get(name)
+            if not isinstance(section, dict):
+                section = data[name] = {}
+            for key, value in defaults.items():
+                if key not in section:
+                    section[key] = copy.deepcopy(value)
+        return data
+
+    def _migrate(self):
+        data = {}
+        for name, filename in LEGACY_FILES.items():
+            try:
+                with open(os.path.join(self.directory, filename), "r") as f:
+                    legacy = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                continue
+            if not isinstance(legacy, dict):
+                continue
+            # Old packdisplay.json defaults were written under a garbage key.
+            legacy.pop("enabled segnali di trading", None)
+            data[name] = legacy
+        if data:
+            self._dirty = True
+        return data
+
+    def section(self, name):
+        with self.lock:
+            section = self.data.get(name)
+            if section is None:
+                section = self.data[name] = copy.deepcopy(DEFAULTS.get(name, {}))
+            return section
+
+    def update(self, name, **values):
+        with self.lock:
+            section = self.data.setdefault(name, {})
+            if all(section.get(k, self) == v for k, v in values.items()):
+                return
+            section.update(values)
+            self._dirty = True
+        self._ensure_writer()
+        self._wake.set()
+
+    def reload(self, text):
+        # Merges an externally edited file and returns {section: changed values}.
+        if hashlib.sha1(text.encode("utf-8")).digest() == self.written_digest:
+            self.echoes += 1
+            return {}
+        # Someone else wrote the file since our last save, so a later revert to that
+        # exact text is theirs too and must not be mistaken for an echo.
+        self.written_digest = None
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        changes = {}
+        with self.lock:
+            for name, values in data.items():
+                if not isinstance(values, dict):
+                    continue
+                section = self.data.setdefault(name, {})
+                changed = {k: v for k, v in values.items() if section.get(k, self) != v}
+                if changed:
+                    section.update(changed)
+                    changes[name] = changed
+        if changes:
+            self.reloads += 1
+        return changes
+
+    def _ensure_writer(self):
+        if self._thread is None and not self._closed and not self.read_only:
+            self._thread = threading.Thread(target=self._run, name="config-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait()
+            deadline = monotonic() + self.max_delay
+            # Coalesce bursts (e.g. drag-release then toggle) into one write.
+            while not self._closed:
+                self._wake.clear()
+                if not self._wake.wait(self.debounce) or monotonic() >= deadline:
+                    break
+            self.flush()
+
+    def flush(self):
+        with self.write_lock:
+            with self.lock:
+                if not self._dirty:
+                    return False
+                text = json.dumps(self.data, indent=4)
+                self._dirty = False
+            # Set before the file appears so the watcher can recognise our own write.
+            self.written_digest = hashlib.sha1(text.encode("utf-8")).digest()
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except OSError:
+                self.write_errors += 1
+                with self.lock:
+                    self._dirty = True
+                return False
+            self.writes += 1
+            return True
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self.flush()
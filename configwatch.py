@@ -0,0 +1,108 @@
+import os
+import sys
+import struct
+import select
+import ctypes
+import ctypes.util
+import threading
+from eventbus import CONFIG
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc():
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    return libc
+
+
+class ConfigWatcher:
+    # Watches the directory rather than the file: ConfigStore (and most editors)
+    # replace the file, which would silently end a watch on the old inode.
+    def __init__(self, store, bus):
+        self.store = store
+        self.bus = bus
+        self.filename = os.path.basename(store.path).encode()
+        libc = _load_libc()
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        directory = os.path.dirname(os.path.abspath(store.path)).encode()
+        if libc.inotify_add_watch(self.fd, directory, IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, "inotify_add_watch failed")
+        self.stop_r, self.stop_w = os.pipe()
+        self.events = 0
+        self.applied = 0
+        self.thread = threading.Thread(target=self.run, name="config-watch", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def run(self):
+        try:
+            while True:
+                # Blocks in the kernel until the directory changes or stop() is called.
+                ready, _, _ = select.select([self.fd, self.stop_r], [], [])
+                if self.stop_r in ready:
+                    break
+                try:
+                    data = os.read(self.fd, 4096)
+                except BlockingIOError:
+                    continue
+                if self.touched(data):
+                    self.reload()
+        finally:
+            os.close(self.fd)
+            os.close(self.stop_r)
+
+    def touched(self, data):
+        offset = 0
+        found = False
+        while offset + EVENT_HEADER.size <= len(data):
+            _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            self.events += 1
+            if name == self.filename:
+                found = True
+        return found
+
+    def reload(self):
+        try:
+            with open(self.store.path, "r") as f:
+                text = f.read()
+        except OSError:
+            return
+        # The store ignores its own writes and returns only what actually changed; each
+        # section goes to the Tk thread as a bus event for the overlay that owns it.
+        for section, changes in self.store.reload(text).items():
+            self.applied += 1
+            self.bus.post(CONFIG, section, changes)
+
+    def stop(self):
+        try:
+            os.write(self.stop_w, b"x")
+            os.close(self.stop_w)
+        except OSError:
+            pass
+        self.thread.join(1.0)
+
+
+def watch_config(store, bus):
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ConfigWatcher(store, bus).start()
+    except (OSError, AttributeError):
+        return None
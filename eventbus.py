@@ -0,0 +1,163 @@
+import threading
+from collections import deque
+from time import perf_counter_ns
+import tracing
+
+KEYBOARD = 0
+MOUSE = 1
+HIT = 2
+# Posted by the config watcher: code is the section name, down the changed values.
+CONFIG = 3
+
+MOUSE_LEFT = 1
+MOUSE_RIGHT = 2
+MOUSE_MIDDLE = 3
+MOUSE_BUTTONS = {"left": MOUSE_LEFT, "right": MOUSE_RIGHT, "middle": MOUSE_MIDDLE}
+
+
+class EventBus:
+    def __init__(self, window, interval=10):
+        self.window = window
+        self.interval = interval
+        # deque.append/popleft are atomic, so hook threads never take a lock here.
+        self.queue = deque()
+        self.handlers = {}
+        self.drained = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_drain_ns = 0
+        self.max_drain_ns = 0
+        self.running = False
+        self.mouse_hooked = False
+        # Set by a FrameScheduler that drains this bus instead of the after() loop.
+        self.on_wake = None
+        self.sleeping = False
+
+    def post(self, device, code, down, t=None):
+        self.queue.append((perf_counter_ns() if t is None else t, device, code, down))
+        if self.sleeping:
+            self.sleeping = False
+            if self.on_wake is not None:
+                self.on_wake()
+
+    def settle(self):
+        # Mark the bus asleep, then re-check: a post racing with this either sees the
+        # flag and wakes the scheduler, or left an event we report here.
+        self.sleeping = True
+        if self.queue:
+            self.sleeping = False
+            return False
+        return True
+
+    def subscribe(self, device, callback):
+        self.handlers.setdefault(device, []).append(callback)
+
+    def unsubscribe(self, device, callback):
+        callbacks = self.handlers.get(device)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def start(self):
+        if not self.running and self.on_wake is None:
+            self.running = True
+            self.window.after(self.interval, self._tick)
+
+    def stop(self):
+        self.running = False
+
+    def _tick(self):
+        if not self.running:
+            return
+        self.drain()
+        self.window.after(self.interval, self._tick)
+
+    def drain(self):
+        queue = self.queue
+        pending = len(queue)
+        if not pending:
+            return 0
+        start = perf_counter_ns()
+        if pending > self.max_depth:
+            self.max_depth = pending
+        handlers = self.handlers
+        tracer = tracing.tracer
+        if tracer is not None:
+            queued = tracer.stage("input_queue")
+        # Only take what was queued when the drain began so a flood can't starve Tk.
+        for _ in range(pending):
+            t, device, code, down = queue.popleft()
+            if tracer is not None:
+                queued.record(start - t)
+            for callback in handlers.get(device, ()):
+                # One broken handler must not cost the others their events.
+                try:
+                    callback(t, code, down)
+                except Exception:
+                    self.errors += 1
+        self.drained += pending
+        elapsed = perf_counter_ns() - start
+        self.last_drain_ns = elapsed
+        if elapsed > self.max_drain_ns:
+            self.max_drain_ns = elapsed
+        return pending
+
+    def stats(self):
+        return {
+            "depth": len(self.queue),
+            "max_depth": self.max_depth,
+            "drained": self.drained,
+            "errors": self.errors,
+            "last_drain_us": self.last_drain_ns / 1000,
+            "max_drain_us": self.max_drain_ns / 1000,
+        }
+
+
+def click_callback(bus, codes):
+    # The exact callbacks handed to pynput and keyboard; stress.py drives them directly.
+    post = bus.post
+    def on_click(x, y, button, pressed):
+        code = codes.get(button)
+        if code is not None:
+            post(MOUSE, code, pressed)
+    return on_click
+
+
+def key_callback(bus, key_down="down"):
+    post = bus.post
+    def on_key_event(e):
+        post(KEYBOARD, e.scan_code, e.event_type == key_down)
+    return on_key_event
+
+
+def start_mouse_hook(bus):
+    # One pynput listener per bus, however many overlays want mouse buttons.
+    if bus.mouse_hooked:
+        return
+    bus.mouse_hooked = True
+    def listen():
+        from pynput import mouse
+        codes = {mouse.Button.left: MOUSE_LEFT, mouse.Button.right: MOUSE_RIGHT, mouse.Button.middle: MOUSE_MIDDLE}
+        mouse.Listener(on_click=click_callback(bus, codes)).start()
+    threading.Thread(target=listen, name="mouse-hook", daemon=True).start()
+
+
+def start_key_hook(bus, names, on_ready=None, hook=True):
+    # Hooks only the named keys by scan code. keyboard's listener still decodes every
+    # keystroke in Python, but other keys never reach our callback or the bus.
+    # hook=False only resolves the scan codes, which is what a replayed recording needs.
+    def listen():
+        import keyboard
+        on_key_event = key_callback(bus, keyboard.KEY_DOWN)
+        codes = {}
+        for name in names:
+            try:
+                codes[name] = keyboard.key_to_scan_codes(name)
+            except ValueError:
+                continue
+        if on_ready is not None:
+            on_ready(codes)
+        if not hook:
+            return
+        for name in codes:
+            keyboard.hook_key(name, on_key_event)
+    threading.Thread(target=listen, name="key-hook", daemon=True).start()
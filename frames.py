@@ -0,0 +1,265 @@
+import zlib
+import struct
+import random
+from time import perf_counter, perf_counter_ns, process_time, sleep
+
+REPLAY_MAGIC = b"OCFR"
+REPLAY_HEADER = struct.Struct("<4sHHI")
+FRAME_HEADER = struct.Struct("<Q")
+
+
+def is_red(buf, offset):
+    # Buffers are 32-bit BGRA/BGRX, the native ZPixmap layout on little-endian X servers.
+    return buf[offset + 2] > 200 and buf[offset + 1] < 50 and buf[offset] < 50
+
+
+class FrameSource:
+    name = "source"
+    width = 0
+    height = 0
+    stride = 0
+    buffer = None
+    center_offset = 0
+
+    def grab(self):
+        raise NotImplementedError
+
+    def center_is_red(self):
+        return self.grab() and is_red(self.buffer, self.center_offset)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _fill(frame, stride, width, height, color):
+    b, g, r = color[2], color[1], color[0]
+    for y in range(height):
+        row = y * stride
+        for x in range(width):
+            o = row + x * 4
+            frame[o] = b
+            frame[o + 1] = g
+            frame[o + 2] = r
+            frame[o + 3] = 255
+
+
+def _crosshair(frame, stride, width, height, color, arm):
+    cx, cy = width // 2, height // 2
+    b, g, r = color[2], color[1], color[0]
+    for d in range(-arm, arm + 1):
+        for x, y in ((cx + d, cy), (cx, cy + d)):
+            if 0 <= x < width and 0 <= y < height:
+                o = y * stride + x * 4
+                frame[o] = b
+                frame[o + 1] = g
+                frame[o + 2] = r
+
+
+def _scheduled_hits(fps, hit_rate, jitter, seed):
+    if hit_rate <= 0:
+        return
+    rng = random.Random(seed)
+    period = fps / hit_rate
+    start = period
+    while True:
+        yield int(start) + (rng.randint(-jitter, jitter) if jitter else 0)
+        start += period
+
+
+class SyntheticSource(FrameSource):
+    name = "synthetic"
+
+    def __init__(self, width=16, height=16, fps=240, hit_rate=2.0, hit_frames=6, hits=None,
+                 jitter=0, seed=0, background=(90, 110, 70), crosshair=(255, 255, 255),
+                 hit_color=(235, 20, 20)):
+        self.width = width
+        self.height = height
+        self.stride = width * 4
+        self.fps = fps
+        self.hit_frames = hit_frames
+        self.buffer = bytearray(self.stride * height)
+        self.center_offset = (height // 2) * self.stride + (width // 2) * 4
+        self.idle_frame = bytearray(len(self.buffer))
+        _fill(self.idle_frame, self.stride, width, height, background)
+        _crosshair(self.idle_frame, self.stride, width, height, crosshair, max(1, width // 4))
+        self.hit_frame = bytearray(self.idle_frame)
+        _crosshair(self.hit_frame, self.stride, width, height, hit_color, max(1, width // 4))
+        if hits is None:
+            self.hits = _scheduled_hits(fps, hit_rate, jitter, seed)
+        else:
+            self.hits = iter(sorted(hits))
+        self.frame_index = -1
+        self._next_hit = next(self.hits, None)
+        self._hit_until = -1
+        self.in_hit = False
+        self.hit_started = False
+
+    def grab(self):
+        self.frame_index += 1
+        i = self.frame_index
+        self.hit_started = False
+        if self._next_hit is not None and self._next_hit <= i:
+            self._next_hit = next(self.hits, None)
+            self._hit_until = i + self.hit_frames
+            self.hit_started = True
+        in_hit = i < self._hit_until
+        if in_hit != self.in_hit or i == 0:
+            self.buffer[:] = self.hit_frame if in_hit else self.idle_frame
+            self.in_hit = in_hit
+        return True
+
+    def frame_time(self):
+        return self.frame_index / self.fps
+
+
+class ReplaySource(FrameSource):
+    name = "replay"
+
+    def __init__(self, path, loop=False, realtime=False):
+        self.file = open(path, "rb")
+        magic, self.width, self.height, self.stride = REPLAY_HEADER.unpack(
+            self.file.read(REPLAY_HEADER.size)
+        )
+        if magic != REPLAY_MAGIC:
+            self.file.close()
+            raise ValueError(f"{path} is not a frame recording")
+        self.loop = loop
+        self.realtime = realtime
+        self.buffer = bytearray(self.stride * self.height)
+        self.center_offset = (self.height // 2) * self.stride + (self.width // 2) * 4
+        self._stamp = bytearray(FRAME_HEADER.size)
+        self._first_stamp = None
+        self._started = 0
+        self.frame_index = -1
+
+    def grab(self):
+        if self.file.readinto(self._stamp) != len(self._stamp):
+            if not self.loop:
+                return False
+            self.file.seek(REPLAY_HEADER.size)
+            self._first_stamp = None
+            return self.grab()
+        if self.file.readinto(self.buffer) != len(self.buffer):
+            return False
+        self.frame_index += 1
+        if self.realtime:
+            stamp = FRAME_HEADER.unpack_from(self._stamp)[0]
+            if self._first_stamp is None:
+                self._first_stamp = stamp
+                self._started = perf_counter_ns()
+            delay = (stamp - self._first_stamp) - (perf_counter_ns() - self._started)
+            if delay > 0:
+                sleep(delay / 1e9)
+        return True
+
+    def close(self):
+        self.file.close()
+
+
+def record_frames(source, path, frames):
+    written = 0
+    with open(path, "wb") as f:
+        f.write(REPLAY_HEADER.pack(REPLAY_MAGIC, source.width, source.height, source.stride))
+        stamp = bytearray(FRAME_HEADER.size)
+        while written < frames and source.grab():
+            FRAME_HEADER.pack_into(stamp, 0, perf_counter_ns())
+            f.write(stamp)
+            f.write(source.buffer)
+            written += 1
+    return written
+
+
+def screen_source(width=16, height=16, center=None):
+    from capture import create_capture
+    return create_capture(width, height, center)
+
+
+def open_source(spec="screen", width=16, height=16):
+    if spec == "screen":
+        return screen_source(width, height)
+    if spec == "synthetic":
+        return SyntheticSource(width, height)
+    if spec.startswith("replay:"):
+        return ReplaySource(spec[len("replay:"):], loop=True, realtime=True)
+    raise ValueError(f"unknown frame source {spec!r}")
+
+
+def benchmark_detection(source, frames, scheduler=None):
+    checks = 0
+    detected = 0
+    latencies = []
+    pending = []
+    armed = True
+    last_crc = 0
+    start = perf_counter()
+    cpu_start = process_time()
+    while checks < frames:
+        if scheduler is not None:
+            scheduler.wait()
+        red = source.center_is_red()
+        checks += 1
+        if getattr(source, "hit_started", False):
+            pending.append(source.frame_index)
+        if red:
+            if armed:
+                armed = False
+                detected += 1
+                if pending:
+                    latencies.append(source.frame_index - pending.pop(0))
+        elif not armed:
+            armed = True
+        if scheduler is not None:
+            crc = zlib.crc32(source.buffer)
+            scheduler.mark(crc != last_crc)
+            last_crc = crc
+    elapsed = perf_counter() - start
+    cpu = process_time() - cpu_start
+    result = {
+        "source": source.name,
+        "checks": checks,
+        "checks_per_second": checks / elapsed if elapsed else 0.0,
+        "hits_detected": detected,
+        "cpu_percent": 100.0 * cpu / elapsed if elapsed else 0.0,
+    }
+    if latencies:
+        result["hits_missed"] = len(pending)
+        result["latency_frames_max"] = max(latencies)
+        result["latency_frames_mean"] = sum(latencies) / len(latencies)
+    if scheduler is not None:
+        result.update(scheduler.stats())
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark hit detection against a frame source")
+    parser.add_argument("source", choices=["synthetic", "replay", "screen"])
+    parser.add_argument("--file", help="recording to play back, or to write with --record")
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--hit-rate", type=float, default=2.0)
+    parser.add_argument("--fps", type=int, default=240)
+    parser.add_argument("--hz", type=float, help="pace checks with the adaptive poll scheduler")
+    parser.add_argument("--record", action="store_true", help="record the source to --file instead")
+    args = parser.parse_args()
+    if args.source == "synthetic":
+        src = SyntheticSource(fps=args.fps, hit_rate=args.hit_rate)
+    elif args.source == "replay":
+        src = ReplaySource(args.file, loop=True)
+    else:
+        src = screen_source()
+    with src:
+        if args.record:
+            print(f"recorded {record_frames(src, args.file, args.frames)} frames to {args.file}")
+        else:
+            scheduler = None
+            if args.hz:
+                from scheduler import PollScheduler
+                scheduler = PollScheduler(args.hz)
+            for k, v in benchmark_detection(src, args.frames, scheduler).items():
+                print(f"{k}: {v:.1f}" if isinstance(v, float) else f"{k}: {v}")
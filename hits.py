@@ -0,0 +1,61 @@
+import threading
+from collections import deque, namedtuple
+
+# t is the perf_counter_ns of the capture that showed the hit; seq counts hits from 1.
+HitEvent = namedtuple("HitEvent", "t seq")
+
+
+class HitStream:
+    # Inline subscribers run on the detector thread and must be quick (the hit sound);
+    # everything else is handed to one dispatcher thread so it can't stall detection.
+    def __init__(self):
+        self.inline = []
+        self.subscribers = []
+        self.queue = deque()
+        self.wake = threading.Event()
+        self.thread = None
+        self.running = True
+        self.published = 0
+        self.errors = 0
+
+    def subscribe(self, callback, inline=False):
+        if inline:
+            self.inline.append(callback)
+            return
+        self.subscribers.append(callback)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.dispatch, name="hit-dispatch", daemon=True)
+            self.thread.start()
+
+    def unsubscribe(self, callback):
+        for callbacks in (self.inline, self.subscribers):
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def publish(self, event):
+        self.published += 1
+        for callback in self.inline:
+            try:
+                callback(event)
+            except Exception:
+                self.errors += 1
+        if self.subscribers:
+            self.queue.append(event)
+            self.wake.set()
+
+    def dispatch(self):
+        queue = self.queue
+        while self.running:
+            self.wake.wait()
+            self.wake.clear()
+            while queue:
+                event = queue.popleft()
+                for callback in self.subscribers:
+                    try:
+                        callback(event)
+                    except Exception:
+                        self.errors += 1
+
+    def close(self):
+        self.running = False
+        self.wake.set()
@@ -0,0 +1,124 @@
+from array import array
+from clickrate import ClickCounter
+from tracing import LatencyHistogram
+
+MAX_KEYS = 64
+
+
+class KeyStats:
+    # Everything is allocated up front: per-key arrays indexed by a small key index,
+    # one hold-time histogram per key and bounded deques for KPS, so a session of
+    # any length uses the same memory.
+    def __init__(self, capacity=MAX_KEYS, strafe=("a", "d"), kps_window=1.0):
+        self.capacity = capacity
+        self.names = []
+        self.index = {}
+        self.presses = array("Q", bytes(8 * capacity))
+        self.down_at = array("q", bytes(8 * capacity))
+        self.holds = [LatencyHistogram() for _ in range(capacity)]
+        self.kps = ClickCounter(kps_window)
+        self.strafe = tuple(self.key(name) for name in strafe) if len(strafe) == 2 else ()
+        self.last_strafe = -1
+        self.last_strafe_up = 0
+        self.switches = 0
+        self.overlap_key = -1
+        self.overlap_since = 0
+        self.switch_gaps = LatencyHistogram()
+        self.switch_overlaps = LatencyHistogram()
+        self.total = 0
+        self.first = 0
+        self.last = 0
+
+    def key(self, name):
+        # Returns -1 once capacity is used up; those keys are simply not tracked.
+        index = self.index.get(name)
+        if index is None:
+            if len(self.names) >= self.capacity:
+                return -1
+            index = self.index[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def record(self, t, index, down):
+        if index < 0:
+            return
+        if down:
+            self.presses[index] += 1
+            self.down_at[index] = t
+            self.kps.add(t)
+            self.total += 1
+            if not self.first:
+                self.first = t
+            self.last = t
+            if index in self.strafe:
+                self.strafe_down(t, index)
+        else:
+            start = self.down_at[index]
+            if start:
+                self.holds[index].record(t - start)
+                self.down_at[index] = 0
+            if self.overlap_since and (index == self.overlap_key or index == self.last_strafe):
+                # Whichever side lets go first ends the time both were held.
+                self.switch_overlaps.record(t - self.overlap_since)
+                self.overlap_key = -1
+                self.overlap_since = 0
+            if index == self.last_strafe:
+                self.last_strafe_up = t
+
+    def strafe_down(self, t, index):
+        other = self.last_strafe
+        self.last_strafe = index
+        if other < 0 or other == index:
+            return
+        self.switches += 1
+        if self.down_at[other]:
+            # Pressed before the other side was released: the overlap is measured
+            # when one of the two keys comes up.
+            self.overlap_key = other
+            self.overlap_since = t
+        else:
+            self.switch_gaps.record(t - self.last_strafe_up)
+
+    def summary(self, now=None):
+        keys = {}
+        for index, name in enumerate(self.names):
+            holds = self.holds[index]
+            keys[name] = {
+                "presses": self.presses[index],
+                "hold_p50_ms": holds.percentile(50) / 1e6,
+                "hold_p90_ms": holds.percentile(90) / 1e6,
+                "hold_max_ms": holds.max / 1e6,
+            }
+        elapsed = (self.last - self.first) / 1e9
+        return {
+            "presses": self.total,
+            "kps": self.kps.rate(now),
+            "peak_kps": self.kps.peak_rate(),
+            "mean_kps": self.total / elapsed if elapsed > 0 else 0.0,
+            "strafe_switches": self.switches,
+            "strafe_gap_p50_ms": self.switch_gaps.percentile(50) / 1e6,
+            "strafe_gap_p90_ms": self.switch_gaps.percentile(90) / 1e6,
+            "strafe_overlaps": self.switch_overlaps.total,
+            "strafe_overlap_p50_ms": self.switch_overlaps.percentile(50) / 1e6,
+            "keys": keys,
+        }
+
+    def format_summary(self, now=None):
+        summary = self.summary(now)
+        lines = [
+            f"keys: {summary['presses']} presses, {summary['kps']:.1f} kps now, "
+            f"{summary['peak_kps']:.0f} peak, {summary['mean_kps']:.2f} mean",
+        ]
+        if self.strafe:
+            lines.append(
+                f"strafe: {summary['strafe_switches']} switches, gap p50 {summary['strafe_gap_p50_ms']:.0f} ms "
+                f"p90 {summary['strafe_gap_p90_ms']:.0f} ms, {summary['strafe_overlaps']} overlapped "
+                f"(p50 {summary['strafe_overlap_p50_ms']:.0f} ms)"
+            )
+        for name, key in summary["keys"].items():
+            if key["presses"]:
+                lines.append(
+                    f"  {name:<8}{key['presses']:>7}  hold p50 {key['hold_p50_ms']:6.0f} ms"
+                    f"  p90 {key['hold_p90_ms']:6.0f} ms  max {key['hold_max_ms']:6.0f} ms"
+                )
+        return "\n".join(lines)
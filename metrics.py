@@ -0,0 +1,139 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = "ocean_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Components keep plain counters in their hot paths; they are only read here, on a scrape.
+METRICS = {
+    "detector_loops_total": ("counter", "Detector loop iterations."),
+    "detector_rate_hz": ("gauge", "Detector loop rate over the last second."),
+    "detector_capture_seconds": ("gauge", "Duration of the last screen capture."),
+    "detector_hits_total": ("counter", "Hits that triggered the sound."),
+    "sound_trigger_last_seconds": ("gauge", "Time the last Sound.play call took."),
+    "sound_trigger_seconds": ("summary", "Time spent starting hit sounds."),
+    "input_events_total": ("counter", "Input events delivered to an overlay, by hook."),
+    "clicks_total": ("counter", "Mouse clicks counted by the CPS overlay."),
+    "cps": ("gauge", "Clicks per second currently displayed."),
+    "key_presses_total": ("counter", "Key presses seen by the keystroke overlay; rate() gives KPS."),
+    "strafe_switches_total": ("counter", "Switches between the two strafe keys."),
+    "render_calls_total": ("counter", "Canvas updates issued or skipped by the render cache."),
+    "bus_events_total": ("counter", "Events drained from the input bus."),
+    "bus_queue_depth": ("gauge", "Events waiting on the input bus."),
+    "bus_drain_seconds": ("gauge", "Duration of the last bus drain."),
+    "bus_handler_errors_total": ("counter", "Exceptions raised by bus event handlers."),
+    "tk_ticks_total": ("counter", "Frame scheduler ticks."),
+    "tk_tick_seconds": ("gauge", "Duration of the last frame scheduler tick."),
+    "tk_tick_max_seconds": ("gauge", "Longest frame scheduler tick."),
+    "tk_tick_errors_total": ("counter", "Exceptions raised by overlay ticks."),
+    "tk_awake": ("gauge", "1 while the frame scheduler has a tick pending."),
+    "config_writes_total": ("counter", "Config file writes."),
+    "config_write_errors_total": ("counter", "Config file writes that failed."),
+}
+
+
+def app_samples(app):
+    store = app.store
+    yield "config_writes_total", {}, store.writes
+    yield "config_write_errors_total", {}, store.write_errors
+    if app.bus is not None:
+        bus = app.bus
+        yield "bus_events_total", {}, bus.drained
+        yield "bus_queue_depth", {}, len(bus.queue)
+        yield "bus_drain_seconds", {}, bus.last_drain_ns / 1e9
+        yield "bus_handler_errors_total", {}, bus.errors
+    if app.scheduler is not None:
+        scheduler = app.scheduler
+        yield "tk_ticks_total", {}, scheduler.ticks
+        yield "tk_tick_seconds", {}, scheduler.last_tick_ns / 1e9
+        yield "tk_tick_max_seconds", {}, scheduler.max_tick_ns / 1e9
+        yield "tk_tick_errors_total", {}, scheduler.errors
+        yield "tk_awake", {}, int(scheduler.pending is not None)
+    for addon in list(app.addons.values()):
+        metrics = getattr(addon, "metrics", None)
+        if metrics is not None:
+            yield from metrics()
+
+
+def family(name):
+    for suffix in ("_sum", "_count"):
+        if name.endswith(suffix) and name[:-len(suffix)] in METRICS:
+            return name[:-len(suffix)]
+    return name
+
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def number(value):
+    # Counters must stay exact past a million, which %g would round to 6 digits.
+    if isinstance(value, float) and not value.is_integer():
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(int(value))
+
+
+def render(samples):
+    families = {}
+    for name, labels, value in samples:
+        families.setdefault(family(name), []).append((name, labels, value))
+    lines = []
+    for base, entries in families.items():
+        kind, help_text = METRICS.get(base, ("untyped", ""))
+        lines.append(f"# HELP {PREFIX}{base} {help_text}")
+        lines.append(f"# TYPE {PREFIX}{base} {kind}")
+        for name, labels, value in entries:
+            if labels:
+                label_text = ",".join(f'{key}="{escape(val)}"' for key, val in labels.items())
+                lines.append(f"{PREFIX}{name}{{{label_text}}} {number(value)}")
+            else:
+                lines.append(f"{PREFIX}{name} {number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    def __init__(self, collect, port=9465, host="127.0.0.1"):
+        self.collect = collect
+        self.scrapes = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                server.scrapes += 1
+                body = render(server.collect()).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics", daemon=True)
+
+    @property
+    def address(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def serve_app(app, port=9465, host="127.0.0.1"):
+    return MetricsServer(lambda: app_samples(app), port, host).start()
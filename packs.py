@@ -0,0 +1,203 @@
+import os
+import re
+import sys
+import json
+import zipfile
+import threading
+
+INDEX_FILE = "pack_index.json"
+FORMATTING = re.compile("§.")
+
+
+def minecraft_dir():
+    if sys.platform == "win32":
+        return os.path.join(os.environ.get("APPDATA", os.path.expanduser("~")), ".minecraft")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Application Support/minecraft")
+    return os.path.expanduser("~/.minecraft")
+
+
+def active_pack(options_path):
+    # options.txt lists enabled packs bottom-up; the last file/ entry wins.
+    try:
+        with open(options_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("resourcePacks:"):
+                    packs = json.loads(line.split(":", 1)[1])
+                    break
+            else:
+                return None
+    except (OSError, ValueError):
+        return None
+    for name in reversed(packs):
+        if isinstance(name, str) and name.startswith("file/"):
+            return name[5:]
+    return None
+
+
+def is_pack(path):
+    if os.path.isdir(path):
+        return os.path.isfile(os.path.join(path, "pack.mcmeta"))
+    return path.lower().endswith(".zip") and os.path.isfile(path)
+
+
+def fingerprint(path):
+    # A folder's own mtime misses edits inside it, so use the files we read instead.
+    if os.path.isdir(path):
+        size = 0
+        mtime = 0
+        for name in ("pack.mcmeta", "pack.png"):
+            try:
+                st = os.stat(os.path.join(path, name))
+            except FileNotFoundError:
+                continue
+            size += st.st_size
+            mtime = max(mtime, st.st_mtime_ns)
+        return [size, mtime]
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def description_text(value):
+    if isinstance(value, str):
+        text = value
+    elif isinstance(value, dict):
+        text = description_text(value.get("text", "")) + description_text(value.get("extra", []))
+    elif isinstance(value, list):
+        text = "".join(description_text(part) for part in value)
+    else:
+        text = ""
+    return FORMATTING.sub("", text)
+
+
+def read_pack(path):
+    meta = None
+    icon = None
+    if os.path.isdir(path):
+        try:
+            with open(os.path.join(path, "pack.mcmeta"), "rb") as f:
+                meta = f.read()
+        except OSError:
+            pass
+        try:
+            with open(os.path.join(path, "pack.png"), "rb") as f:
+                icon = f.read()
+        except OSError:
+            pass
+    else:
+        with zipfile.ZipFile(path) as zf:
+            names = set(zf.namelist())
+            if "pack.mcmeta" in names:
+                meta = zf.read("pack.mcmeta")
+            if "pack.png" in names:
+                icon = zf.read("pack.png")
+    name = os.path.basename(path.rstrip("/\\"))
+    if name.lower().endswith(".zip"):
+        name = name[:-4]
+    description = ""
+    try:
+        pack = json.loads(meta.decode("utf-8-sig")).get("pack", {}) if meta else {}
+    except (ValueError, AttributeError):
+        pack = {}
+    if isinstance(pack, dict):
+        description = description_text(pack.get("description", ""))
+        if isinstance(pack.get("name"), str):
+            name = pack["name"]
+    return {
+        "name": FORMATTING.sub("", name),
+        "description": description,
+        "icon": icon,
+    }
+
+
+class PackIndex:
+    # scale_icon(png_bytes, size) returns the base64 PNG stored in the index; the
+    # overlay passes one built on Tk. Without it (the CLI) entries carry no icon.
+    def __init__(self, path, scale_icon=None):
+        self.path = path
+        self.scale_icon = scale_icon
+        self.entries = self.load()
+        self.dirty = False
+        self.reads = 0
+        self.write_lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, path, icon_size=None):
+        # Only stat() on a hit; the zip is opened when its size or mtime changed.
+        path = os.path.abspath(path)
+        try:
+            key = fingerprint(path)
+        except OSError:
+            return None
+        entry = self.entries.get(path)
+        if entry is not None and entry.get("key") == key and icon_size in (None, entry.get("icon_size")):
+            return entry
+        try:
+            entry = read_pack(path)
+        except (OSError, zipfile.BadZipFile):
+            return None
+        self.reads += 1
+        if self.scale_icon is None or not icon_size:
+            icon_size = None
+        icon = entry["icon"]
+        entry["icon"] = self.scale_icon(icon, icon_size) if icon and icon_size else None
+        entry["icon_size"] = icon_size
+        entry["key"] = key
+        entry["path"] = path
+        self.entries[path] = entry
+        self.dirty = True
+        return entry
+
+    def scan(self, directory, icon_size=None):
+        try:
+            names = sorted(os.listdir(directory), key=str.lower)
+        except OSError:
+            return []
+        directory = os.path.abspath(directory)
+        paths = [os.path.join(directory, name) for name in names]
+        packs = [entry for entry in (self.get(p, icon_size) for p in paths if is_pack(p)) if entry]
+        found = {entry["path"] for entry in packs}
+        for path in list(self.entries):
+            if os.path.dirname(path) == directory and path not in found:
+                del self.entries[path]
+                self.dirty = True
+        return packs
+
+    def save(self, background=False):
+        if not self.dirty:
+            return False
+        # Entries are never mutated once built, so a shallow copy is a stable snapshot.
+        entries = dict(self.entries)
+        self.dirty = False
+        if background:
+            threading.Thread(target=self.write, args=(entries,), name="pack-index", daemon=True).start()
+            return True
+        return self.write(entries)
+
+    def write(self, entries):
+        with self.write_lock:
+            tmp = self.path + ".tmp"
+            try:
+                with open(tmp, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp, self.path)
+            except OSError:
+                self.dirty = True
+                return False
+            return True
+
+
+if __name__ == "__main__":
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.path.join(minecraft_dir(), "resourcepacks")
+    index = PackIndex(os.path.join(os.path.dirname(os.path.abspath(__file__)), INDEX_FILE))
+    for entry in index.scan(directory):
+        print(f"{entry['name']:<40} {entry['description'][:60]}")
+    index.save()
+    print(f"{len(index.entries)} packs indexed, {index.reads} read from disk", file=sys.stderr)
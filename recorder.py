@@ -0,0 +1,136 @@
+import queue
+import struct
+import threading
+from time import perf_counter_ns, sleep
+from eventbus import KEYBOARD, MOUSE, HIT
+
+MAGIC = b"OCIN"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+# timestamp ns, code, device, action: 12 bytes, so an hour of busy play is a few MB.
+RECORD = struct.Struct("<QHBB")
+BLOCK_RECORDS = 4096
+
+
+class InputRecorder:
+    def __init__(self, path, block_records=BLOCK_RECORDS):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.block_size = block_records * RECORD.size
+        self.block = bytearray(self.block_size)
+        self.offset = 0
+        self.recorded = 0
+        self.skipped = 0
+        self.blocks = queue.Queue()
+        self.spare = queue.Queue()
+        self.bus = None
+        self.writer = threading.Thread(target=self.write_blocks, name="input-recorder", daemon=True)
+        self.writer.start()
+
+    def attach(self, bus):
+        self.bus = bus
+        bus.subscribe(KEYBOARD, self.on_key)
+        bus.subscribe(MOUSE, self.on_mouse)
+        bus.subscribe(HIT, self.on_hit)
+        return self
+
+    def on_key(self, t, code, down):
+        self.record(t, KEYBOARD, code, down)
+
+    def on_mouse(self, t, code, down):
+        self.record(t, MOUSE, code, down)
+
+    def on_hit(self, t, code, down):
+        self.record(t, HIT, code, down)
+
+    def record(self, t, device, code, down):
+        if not isinstance(code, int) or not 0 <= code <= 0xFFFF:
+            self.skipped += 1
+            return
+        RECORD.pack_into(self.block, self.offset, t, code, device, 1 if down else 0)
+        self.offset += RECORD.size
+        self.recorded += 1
+        if self.offset == self.block_size:
+            self.hand_off()
+
+    def hand_off(self):
+        # The full block goes to the writer thread; recording continues in a recycled one.
+        self.blocks.put((self.block, self.offset))
+        try:
+            self.block = self.spare.get_nowait()
+        except queue.Empty:
+            self.block = bytearray(self.block_size)
+        self.offset = 0
+
+    def write_blocks(self):
+        while True:
+            item = self.blocks.get()
+            if item is None:
+                break
+            block, length = item
+            self.file.write(memoryview(block)[:length])
+            self.file.flush()
+            self.spare.put(block)
+
+    def stop(self):
+        if self.bus is not None:
+            self.bus.unsubscribe(KEYBOARD, self.on_key)
+            self.bus.unsubscribe(MOUSE, self.on_mouse)
+            self.bus.unsubscribe(HIT, self.on_hit)
+            self.bus = None
+        if self.offset:
+            self.hand_off()
+        self.blocks.put(None)
+        self.writer.join()
+        self.file.close()
+
+
+def read_records(path, block_records=BLOCK_RECORDS):
+    with open(path, "rb") as f:
+        magic, version, size = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or size != RECORD.size:
+            raise ValueError(f"{path} is not an input recording")
+        while True:
+            block = f.read(block_records * RECORD.size)
+            if not block:
+                break
+            yield from RECORD.iter_unpack(block[:len(block) - len(block) % RECORD.size])
+
+
+class InputReplayer:
+    def __init__(self, path, bus, speed=1.0):
+        self.path = path
+        self.bus = bus
+        self.speed = speed
+        self.replayed = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def run(self):
+        post = self.bus.post
+        first = None
+        start = perf_counter_ns()
+        for t, code, device, action in read_records(self.path):
+            if self.stop_event.is_set():
+                break
+            if first is None:
+                first = t
+            # Timestamps are rebased onto now so click windows and hold times still line up.
+            due = start + int((t - first) / self.speed) if self.speed else start + (t - first)
+            if self.speed:
+                delay = due - perf_counter_ns()
+                if delay > 0:
+                    sleep(delay / 1e9)
+            post(device, code, bool(action), due)
+            self.replayed += 1
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="input-replayer", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(1.0)
@@ -0,0 +1,41 @@
+class RenderCache:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.text_state = {}
+        self.fill_state = {}
+        self.issued = 0
+        self.skipped = 0
+
+    def text(self, item, value, fmt="{}"):
+        # value is the cheap comparable state; the string is only formatted on change.
+        if self.text_state.get(item) == value:
+            self.skipped += 1
+            return False
+        self.text_state[item] = value
+        if isinstance(value, tuple):
+            text = fmt.format(*value)
+        else:
+            text = fmt.format(value)
+        self.canvas.itemconfigure(item, text=text)
+        self.issued += 1
+        return True
+
+    def fill(self, item, color):
+        if self.fill_state.get(item) == color:
+            self.skipped += 1
+            return False
+        self.fill_state[item] = color
+        self.canvas.itemconfigure(item, fill=color)
+        self.issued += 1
+        return True
+
+    def invalidate(self, item=None):
+        if item is None:
+            self.text_state.clear()
+            self.fill_state.clear()
+        else:
+            self.text_state.pop(item, None)
+            self.fill_state.pop(item, None)
+
+    def stats(self):
+        return {"issued": self.issued, "skipped": self.skipped}
@@ -0,0 +1,101 @@
+import sys
+import atexit
+import math
+from time import perf_counter_ns, sleep
+
+
+_timer_raised = False
+
+
+def _raise_timer_resolution():
+    # Windows sleeps in 15.6 ms steps unless the multimedia timer is raised. The
+    # setting is process-wide and every timeBeginPeriod needs a matching
+    # timeEndPeriod, so it is raised once and released at exit.
+    global _timer_raised
+    if _timer_raised or sys.platform != "win32":
+        return
+    try:
+        import ctypes
+        winmm = ctypes.windll.winmm
+        winmm.timeBeginPeriod(1)
+    except (AttributeError, OSError):
+        return
+    _timer_raised = True
+    atexit.register(winmm.timeEndPeriod, 1)
+
+
+class PollScheduler:
+    def __init__(self, target_hz=240, idle_hz=30, idle_after=1.0, spin_us=200):
+        _raise_timer_resolution()
+        self.target_hz = target_hz
+        self.idle_hz = min(idle_hz, target_hz)
+        self.idle_after_ns = int(idle_after * 1e9)
+        self.spin_ns = int(spin_us * 1000)
+        self.current_hz = target_hz
+        self.period_ns = int(1e9 / target_hz)
+        now = perf_counter_ns()
+        self.deadline = now + self.period_ns
+        self.last_change = now
+        self._backoff_at = now + self.idle_after_ns
+        self.reset_stats(now)
+
+    def reset_stats(self, now=None):
+        self._window_start = now or perf_counter_ns()
+        self._ticks = 0
+        self._late_sum = 0
+        self._late_sq = 0
+        self._late_max = 0
+
+    def _set_rate(self, hz):
+        self.current_hz = hz
+        self.period_ns = int(1e9 / hz)
+
+    def mark(self, changed):
+        now = perf_counter_ns()
+        if changed:
+            self.last_change = now
+            self._backoff_at = now + self.idle_after_ns
+            if self.current_hz != self.target_hz:
+                self._set_rate(self.target_hz)
+                self.deadline = now
+        elif now >= self._backoff_at and self.current_hz > self.idle_hz:
+            self._set_rate(max(self.idle_hz, self.current_hz / 2))
+            self._backoff_at = now + self.idle_after_ns
+
+    def wait(self):
+        deadline = self.deadline
+        remaining = deadline - perf_counter_ns()
+        if remaining > self.spin_ns:
+            sleep((remaining - self.spin_ns) / 1e9)
+        now = perf_counter_ns()
+        while now < deadline:
+            now = perf_counter_ns()
+        late = now - deadline
+        self._ticks += 1
+        self._late_sum += late
+        self._late_sq += late * late
+        if late > self._late_max:
+            self._late_max = late
+        if late > self.period_ns:
+            # Fell behind (e.g. a hit sound or a GC pause); don't burst to catch up.
+            self.deadline = now + self.period_ns
+        else:
+            self.deadline = deadline + self.period_ns
+
+    def stats(self, reset=False):
+        now = perf_counter_ns()
+        elapsed = now - self._window_start
+        n = self._ticks
+        mean = self._late_sum / n if n else 0.0
+        var = self._late_sq / n - mean * mean if n else 0.0
+        result = {
+            "target_hz": self.target_hz,
+            "current_hz": self.current_hz,
+            "achieved_hz": n * 1e9 / elapsed if elapsed else 0.0,
+            "jitter_mean_us": mean / 1000,
+            "jitter_std_us": math.sqrt(max(var, 0.0)) / 1000,
+            "jitter_max_us": self._late_max / 1000,
+        }
+        if reset:
+            self.reset_stats(now)
+        return result
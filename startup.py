@@ -0,0 +1,77 @@
+import sys
+import builtins
+import threading
+from time import perf_counter_ns
+
+FLAG = "--startup-profile"
+
+
+class StartupProfile:
+    def __init__(self, min_import_ms=1.0):
+        self.t0 = perf_counter_ns()
+        self.min_import_ns = int(min_import_ms * 1e6)
+        self.imports = []
+        self.steps = []
+        self.excluded_ns = 0
+        self.main_thread = threading.get_ident()
+        self._depth = 0
+        self._original_import = None
+
+    @classmethod
+    def from_argv(cls, argv):
+        # Checked before argparse runs so main.py's own imports are timed too.
+        if FLAG in argv:
+            return cls().install()
+        return None
+
+    def install(self):
+        original = self._original_import = builtins.__import__
+        modules = sys.modules
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if (level or name in modules) or threading.get_ident() != self.main_thread:
+                return original(name, globals, locals, fromlist, level)
+            depth = self._depth
+            self._depth = depth + 1
+            start = perf_counter_ns()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                self._depth = depth
+                elapsed = perf_counter_ns() - start
+                if elapsed >= self.min_import_ns:
+                    self.imports.append((start, depth, name, elapsed))
+
+        builtins.__import__ = timed_import
+        return self
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def step(self, name, start_ns, end_ns=None):
+        end_ns = perf_counter_ns() if end_ns is None else end_ns
+        self.steps.append((name, end_ns - start_ns))
+
+    def exclude(self, start_ns, end_ns=None):
+        # Time spent waiting on the user (the key prompt) doesn't count against the budget.
+        end_ns = perf_counter_ns() if end_ns is None else end_ns
+        self.excluded_ns += end_ns - start_ns
+
+    def elapsed_ns(self):
+        return perf_counter_ns() - self.t0 - self.excluded_ns
+
+    def report(self, budget_ms, file=None):
+        self.uninstall()
+        file = file or sys.stderr
+        total_ms = self.elapsed_ns() / 1e6
+        print("imports (inclusive ms):", file=file)
+        for _, depth, name, elapsed in sorted(self.imports):
+            print(f"  {'  ' * depth}{name:<{40 - 2 * depth}}{elapsed / 1e6:>9.1f}", file=file)
+        print("startup steps (ms):", file=file)
+        for name, elapsed in self.steps:
+            print(f"  {name:<40}{elapsed / 1e6:>9.1f}", file=file)
+        verdict = "ok" if total_ms <= budget_ms else "OVER BUDGET"
+        print(f"time to first overlay: {total_ms:.1f} ms (budget {budget_ms:.0f} ms, {verdict})", file=file)
+        return total_ms
@@ -0,0 +1,203 @@
+import os
+import sys
+import json
+import random
+import argparse
+import tempfile
+import threading
+from bisect import bisect_right
+from collections import namedtuple
+from time import perf_counter_ns, sleep
+from bench import percentiles, start_xvfb
+from eventbus import KEYBOARD, MOUSE, MOUSE_LEFT, MOUSE_RIGHT, click_callback, key_callback
+
+KeyEvent = namedtuple("KeyEvent", "scan_code event_type")
+BUTTONS = {"left": MOUSE_LEFT, "right": MOUSE_RIGHT}
+
+
+class Injector:
+    # Calls the same callbacks the real hooks get, from its own thread, at a target rate.
+    def __init__(self, name, rate, jitter, emit, seed=0):
+        self.name = name
+        self.interval_ns = 1e9 / rate
+        self.jitter = jitter
+        self.emit = emit
+        self.random = random.Random(seed)
+        self.sent = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"inject-{name}", daemon=True)
+
+    def next_interval(self):
+        if not self.jitter:
+            return self.interval_ns
+        return self.interval_ns * max(0.05, 1 + self.random.uniform(-self.jitter, self.jitter))
+
+    def run(self):
+        due = perf_counter_ns()
+        while not self.stop_event.is_set():
+            now = perf_counter_ns()
+            if due > now + 1_000_000:
+                sleep((due - now - 500_000) / 1e9)
+                continue
+            # Catch up in a burst when the OS oversleeps, like a hook thread would.
+            while due <= now:
+                self.emit(self.sent)
+                self.sent += 1
+                due += self.next_interval()
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join(1.0)
+
+
+class Checker:
+    # Subscribed after the overlays, so it sees exactly what they were dispatched.
+    def __init__(self, bus):
+        self.received = {KEYBOARD: 0, MOUSE: 0}
+        self.misordered = {KEYBOARD: 0, MOUSE: 0}
+        self.last = {KEYBOARD: 0, MOUSE: 0}
+        bus.subscribe(KEYBOARD, self.on_key)
+        bus.subscribe(MOUSE, self.on_mouse)
+
+    def seen(self, device, t):
+        self.received[device] += 1
+        if t < self.last[device]:
+            self.misordered[device] += 1
+        self.last[device] = t
+
+    def on_key(self, t, code, down):
+        self.seen(KEYBOARD, t)
+
+    def on_mouse(self, t, code, down):
+        self.seen(MOUSE, t)
+
+
+def run_stress(cps, kps, seconds, jitter=0.3, frame_ms=10, seed=0):
+    from main import build_app
+    from config_store import ConfigStore
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(ConfigStore(tmp), ["cps", "keystrokes"], listen=False)
+        root = app.root
+        cps_overlay = app.addons["cps"]
+        keys_overlay = app.addons["keystrokes"]
+        checker = Checker(app.bus)
+        on_click = click_callback(app.bus, BUTTONS)
+        on_key = key_callback(app.bus)
+        clicks = []
+        key_names = [name for name in keys_overlay.slots if isinstance(name, str)]
+        key_state = {}
+
+        def click(i):
+            # One injected "click" is a press and a release, as pynput reports it.
+            clicks.append(perf_counter_ns())
+            on_click(0, 0, "left", True)
+            on_click(0, 0, "left", False)
+
+        def mash(i):
+            name = key_names[i % len(key_names)]
+            down = not key_state.get(name, False)
+            key_state[name] = down
+            on_key(KeyEvent(name, "down" if down else "up"))
+
+        injectors = []
+        if cps:
+            injectors.append(Injector("mouse", cps, jitter, click, seed))
+        if kps and key_names:
+            injectors.append(Injector("keyboard", kps, jitter, mash, seed + 1))
+
+        frames = []
+        cps_error = []
+        window_ns = cps_overlay.left_clicks.window_ns
+        last_frame = [perf_counter_ns()]
+
+        def heartbeat():
+            now = perf_counter_ns()
+            frames.append(now - last_frame[0])
+            last_frame[0] = now
+            truth = len(clicks) - bisect_right(clicks, now - window_ns)
+            if clicks and now - clicks[0] > window_ns:
+                cps_error.append(int(cps_overlay.left_cps) - truth * 1e9 / window_ns)
+            root.after(frame_ms, heartbeat)
+
+        app.scheduler.start()
+        root.update()
+        root.after(frame_ms, heartbeat)
+        root.after(int(seconds * 1000), root.quit)
+        for injector in injectors:
+            injector.start()
+        root.mainloop()
+        for injector in injectors:
+            injector.stop()
+        app.bus.drain()
+        root.update()
+        sent = {KEYBOARD: 0, MOUSE: 0}
+        for injector in injectors:
+            if injector.name == "mouse":
+                sent[MOUSE] = injector.sent * 2
+            else:
+                sent[KEYBOARD] = injector.sent
+        stuck = [
+            name for name in key_names
+            if keys_overlay.pressed[keys_overlay.slots[name]] != key_state.get(name, False)
+        ]
+        abs_error = sorted(abs(e) for e in cps_error)
+        result = {
+            "seconds": seconds,
+            "target": {"cps": cps, "kps": kps, "jitter": jitter},
+            "achieved": {name: sent[device] / seconds for name, device in (("mouse", MOUSE), ("keyboard", KEYBOARD))},
+            "dropped": {name: sent[device] - checker.received[device] for name, device in (("mouse", MOUSE), ("keyboard", KEYBOARD))},
+            "misordered": {"mouse": checker.misordered[MOUSE], "keyboard": checker.misordered[KEYBOARD]},
+            "stuck_keys": stuck,
+            "cps_error": {
+                "samples": len(abs_error),
+                "mean_abs": sum(abs_error) / len(abs_error) if abs_error else 0.0,
+                "p99_abs": abs_error[int(len(abs_error) * 0.99)] if abs_error else 0.0,
+                "max_abs": abs_error[-1] if abs_error else 0.0,
+            },
+            "frame_time": percentiles(frames),
+            "bus": app.bus.stats(),
+            "scheduler": app.scheduler.stats(),
+        }
+        app.stop()
+        root.destroy()
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the overlays with synthetic input at high rates")
+    parser.add_argument("--cps", type=float, default=30, help="injected clicks per second")
+    parser.add_argument("--kps", type=float, default=200, help="injected key events per second")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--jitter", type=float, default=0.3, help="relative spread of the injected intervals")
+    parser.add_argument("--frame-ms", type=int, default=10, help="heartbeat used to sample Tk frame times")
+    parser.add_argument("--sweep", help="comma-separated event rates, each run as both cps and kps")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--xvfb", action="store_true", help="start a private Xvfb server")
+    parser.add_argument("--output", help="write the results as JSON")
+    args = parser.parse_args()
+    xvfb = start_xvfb() if args.xvfb else None
+    if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        sys.exit("DISPLAY not set (use --xvfb)")
+    try:
+        if args.sweep:
+            results = {
+                f"{rate}_eps": run_stress(float(rate), float(rate), args.seconds, args.jitter, args.frame_ms, args.seed)
+                for rate in args.sweep.split(",")
+            }
+        else:
+            results = run_stress(args.cps, args.kps, args.seconds, args.jitter, args.frame_ms, args.seed)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":
+    main()
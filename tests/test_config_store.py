@@ -0,0 +1,64 @@
+import json
+from config_store import ConfigStore
+
+
+def make_store(tmp_path, **sections):
+    (tmp_path / "ocean_config.json").write_text(json.dumps(sections))
+    return ConfigStore(str(tmp_path))
+
+
+def save(store, **values):
+    store.update("cps", **values)
+    assert store.flush()
+    with open(store.path) as f:
+        return f.read()
+
+
+def test_own_write_is_an_echo(tmp_path):
+    store = make_store(tmp_path, cps={"x": 10})
+    try:
+        text = save(store, x=20)
+        assert store.reload(text) == {}
+        assert store.echoes == 1
+    finally:
+        store.close()
+
+
+def test_external_edit_is_merged(tmp_path):
+    store = make_store(tmp_path, cps={"x": 10})
+    try:
+        save(store, x=20)
+        assert store.reload(json.dumps({"cps": {"x": 30}})) == {"cps": {"x": 30}}
+        assert store.section("cps")["x"] == 30
+    finally:
+        store.close()
+
+
+def test_revert_to_our_last_write_after_external_edit(tmp_path):
+    store = make_store(tmp_path, cps={"x": 10})
+    try:
+        ours = save(store, x=20)
+        store.reload(json.dumps({"cps": {"x": 30}}))
+        # The user put back exactly what we last wrote: that is their change now.
+        assert store.reload(ours) == {"cps": {"x": 20}}
+        assert store.section("cps")["x"] == 20
+    finally:
+        store.close()
+
+
+def test_unchanged_values_are_not_reported(tmp_path):
+    store = make_store(tmp_path, cps={"x": 10, "y": 5})
+    try:
+        assert store.reload(json.dumps({"cps": {"x": 10, "y": 6}})) == {"cps": {"y": 6}}
+        assert store.reload(json.dumps({"cps": {"x": 10, "y": 6}})) == {}
+    finally:
+        store.close()
+
+
+def test_invalid_json_changes_nothing(tmp_path):
+    store = make_store(tmp_path, cps={"x": 10})
+    try:
+        assert store.reload("{not json") == {}
+        assert store.section("cps")["x"] == 10
+    finally:
+        store.close()
@@ -0,0 +1,68 @@
+from keystats import KeyStats
+
+MS = 1_000_000
+# Timestamps of 0 mean "not held", so every sequence starts well after it.
+T0 = 1000 * MS
+
+
+def press(stats, name, at_ms, down):
+    stats.record(T0 + at_ms * MS, stats.key(name), down)
+
+
+def test_overlap_is_time_both_keys_were_held():
+    stats = KeyStats()
+    press(stats, "a", 0, True)
+    press(stats, "d", 100, True)
+    press(stats, "a", 150, False)
+    press(stats, "d", 300, False)
+    assert stats.switches == 1
+    assert stats.switch_overlaps.total == 1
+    # Not a's 150 ms hold, and not d's hold either.
+    assert stats.switch_overlaps.max == 50 * MS
+    assert stats.switch_gaps.total == 0
+
+
+def test_overlap_ends_when_new_key_is_released_first():
+    stats = KeyStats()
+    press(stats, "a", 0, True)
+    press(stats, "d", 100, True)
+    press(stats, "d", 130, False)
+    press(stats, "a", 200, False)
+    assert stats.switch_overlaps.total == 1
+    assert stats.switch_overlaps.max == 30 * MS
+
+
+def test_gap_between_release_and_other_press():
+    stats = KeyStats()
+    press(stats, "a", 0, True)
+    press(stats, "a", 100, False)
+    press(stats, "d", 140, True)
+    press(stats, "d", 200, False)
+    assert stats.switches == 1
+    assert stats.switch_gaps.total == 1
+    assert stats.switch_gaps.max == 40 * MS
+    assert stats.switch_overlaps.total == 0
+
+
+def test_repeating_one_side_is_not_a_switch():
+    stats = KeyStats()
+    for i in range(3):
+        press(stats, "a", i * 100, True)
+        press(stats, "a", i * 100 + 50, False)
+    assert stats.switches == 0
+    assert stats.switch_gaps.total == 0
+    assert stats.switch_overlaps.total == 0
+
+
+def test_alternating_switches_record_one_sample_each():
+    stats = KeyStats()
+    press(stats, "a", 0, True)
+    press(stats, "d", 80, True)
+    press(stats, "a", 100, False)
+    press(stats, "d", 200, False)
+    press(stats, "a", 230, True)
+    press(stats, "a", 300, False)
+    assert stats.switches == 2
+    assert stats.switch_overlaps.max == 20 * MS
+    assert stats.switch_gaps.max == 30 * MS
+    assert stats.summary()["strafe_switches"] == 2
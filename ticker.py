@@ -0,0 +1,115 @@
+import tkinter as tk
+from time import perf_counter_ns
+
+WAKE_EVENT = "<<Wake>>"
+
+
+class FrameScheduler:
+    # One timer on the Tk root for every overlay. A widget registers with an
+    # `enabled` flag and a tick(now) that returns True while it still has frames
+    # to draw; once nothing is active and the bus is empty, no timer is pending.
+    def __init__(self, root, fps=100, bus=None):
+        self.root = root
+        self.interval = max(1, round(1000 / fps))
+        self.widgets = []
+        self.active = set()
+        self.bus = None
+        self.pending = None
+        self.ticking = False
+        self.running = False
+        self.ticks = 0
+        self.hidden = 0
+        self.errors = 0
+        self.last_tick_ns = 0
+        self.max_tick_ns = 0
+        root.bind(WAKE_EVENT, self.on_wake_event, add="+")
+        if bus is not None:
+            self.attach(bus)
+
+    def attach(self, bus):
+        # The scheduler drains the bus itself; hook threads wake it when it sleeps.
+        self.bus = bus
+        bus.on_wake = self.wake_from_thread
+
+    def register(self, widget):
+        self.widgets.append(widget)
+        self.wake(widget)
+
+    def unregister(self, widget):
+        if widget in self.widgets:
+            self.widgets.remove(widget)
+        self.active.discard(widget)
+
+    def start(self):
+        self.running = True
+        self.schedule(0)
+
+    def stop(self):
+        self.running = False
+        if self.pending is not None:
+            self.root.after_cancel(self.pending)
+            self.pending = None
+
+    def wake(self, widget=None):
+        if widget is not None:
+            self.active.add(widget)
+        if not self.ticking:
+            self.schedule(0)
+
+    def wake_from_thread(self):
+        # Only called on the sleeping -> awake edge, so at most once per idle spell.
+        # Tkinter hands event_generate to the Tk thread; it fails once the loop is gone.
+        try:
+            self.root.event_generate(WAKE_EVENT, when="tail")
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def on_wake_event(self, event=None):
+        self.wake()
+
+    def schedule(self, delay):
+        if self.running and self.pending is None:
+            self.pending = self.root.after(delay, self.tick)
+
+    def tick(self):
+        self.pending = None
+        self.ticking = True
+        start = perf_counter_ns()
+        try:
+            if self.bus is not None:
+                self.bus.drain()
+            for widget in list(self.active):
+                if not widget.enabled:
+                    self.active.discard(widget)
+                    self.hidden += 1
+                    continue
+                try:
+                    busy = widget.tick(start)
+                except Exception:
+                    self.errors += 1
+                    busy = False
+                if not busy:
+                    self.active.discard(widget)
+        finally:
+            # Always re-arm: skipping this would leave the bus marked awake with no
+            # timer pending, and no later post would ever wake the scheduler again.
+            self.ticking = False
+            self.ticks += 1
+            elapsed = perf_counter_ns() - start
+            self.last_tick_ns = elapsed
+            if elapsed > self.max_tick_ns:
+                self.max_tick_ns = elapsed
+            if self.active or (self.bus is not None and not self.bus.settle()):
+                self.schedule(self.interval)
+
+    def stats(self):
+        return {
+            "ticks": self.ticks,
+            "awake": self.pending is not None,
+            "active": len(self.active),
+            "widgets": len(self.widgets),
+            "hidden_skips": self.hidden,
+            "errors": self.errors,
+            "last_tick_us": self.last_tick_ns / 1000,
+            "max_tick_us": self.max_tick_ns / 1000,
+        }